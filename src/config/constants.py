@@ -7,7 +7,8 @@ __version__ = "1.0.0"
 
 # Refresh rates and intervals
 __sync_refresh_rate__ = 2
-__track_focused_task_interval__ = 0.1
+__search_debounce_delay__ = 0.05  # Seconds of typing pause before the search filter runs
+__refresh_coalesce_delay__ = 0.05  # Seconds a toggle waits so repeated presses refresh once (>= key repeat)
 
 # Regular expressions for parsing todo.txt format
 STRIP_X_FROM_TASK = r"^x\s"
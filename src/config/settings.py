@@ -50,9 +50,30 @@ SETTINGS = [
     ("hideTasksWithThresholdDates", "true"),
 ]
 
+# Position of each setting in SETTINGS, so a setting can be updated in place without a scan
+SETTINGS_INDEX = {key: i for i, (key, _) in enumerate(SETTINGS)}
+
+# Parsed setting values, built from SETTINGS at import and updated by toggle_setting()
+SETTINGS_BOOL = {}
+
+
+def recompute_settings_map():
+    """Build SETTINGS_BOOL from SETTINGS (run at import; toggle_setting() keeps both in sync)."""
+    SETTINGS_BOOL.clear()
+    SETTINGS_BOOL.update((key, value.lower() == "true") for key, value in SETTINGS)
+
 
 def setting_enabled(setting):
     """Check if a setting is enabled (value is 'true')."""
-    return any(
-        item for item in SETTINGS if item[0] == setting and item[1].lower() == "true"
-    )
+    return SETTINGS_BOOL.get(setting, False)
+
+
+def toggle_setting(setting):
+    """Flip a boolean setting in both SETTINGS and SETTINGS_BOOL and return its new value."""
+    enabled = not SETTINGS_BOOL.get(setting, False)
+    SETTINGS_BOOL[setting] = enabled
+    SETTINGS[SETTINGS_INDEX[setting]] = (setting, "true" if enabled else "false")
+    return enabled
+
+
+recompute_settings_map()
@@ -1,6 +1,7 @@
 import urwid
 import sys
 import os
+import stat
 from typing import Optional
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -11,9 +12,9 @@ if parent_dir not in sys.path:
 from src.config.constants import (
     __version__,
     __sync_refresh_rate__,
-    __track_focused_task_interval__,
 )
 from src.config.settings import PALETTE
+from src.services.file_watcher import FileWatcher
 from src.services.task_service import Tasks
 from src.ui.components import Body, Search
 
@@ -56,13 +57,19 @@ def validate_file_path(txt_file: str) -> bool:
         txt_file: Path to the todo.txt file
 
     Returns:
-        True if file exists, False otherwise
+        True if the file exists and is not a directory, False otherwise
     """
-    if not os.path.exists(txt_file):
+    # One stat tells both whether the path exists and whether it is a directory
+    try:
+        file_stat = os.stat(txt_file)
+    except OSError:  # Missing or unreachable, as os.path.exists() treated it
         print(
             f"The file '{txt_file}' does not exist. Are you sure you specified the correct path?"
         )
         return False
+    if stat.S_ISDIR(file_stat.st_mode):
+        print(f"'{txt_file}' is a directory. Please specify the path to your todo.txt file.")
+        return False
     return True
 
 
@@ -81,18 +88,16 @@ def setup_ui_components(txt_file: str) -> tuple[Body, urwid.Frame]:
     tasklist_decorations = urwid.LineBox(tasklist, title="Tasks")
     tasklist.tasklist_decorations = tasklist_decorations  # type: ignore
 
-    # Use Search instead of urwid.Edit for search field
-    search = Search(tasklist_instance=tasklist, caption="Search: ")
-    search_decorations = urwid.LineBox(search)
-
-    # Connect search functionality
-    urwid.connect_signal(
-        search,
-        "change",
-        lambda edit_widget, search_query: Tasks.search(
-            edit_widget, search_query, txt_file, tasklist.tasklist_instance
+    # Use Search instead of urwid.Edit for search field; it filters the tasks as
+    # the query changes, debouncing typed input
+    search = Search(
+        tasklist_instance=tasklist,
+        caption="Search: ",
+        on_search=lambda search_query: Tasks.search(
+            search, search_query, txt_file, tasklist.tasklist_instance
         ),
     )
+    search_decorations = urwid.LineBox(search)
 
     # Create a Frame to contain the search field and the tasklist
     main_frame = urwid.Frame(tasklist_decorations, header=search_decorations)
@@ -103,7 +108,7 @@ def setup_ui_components(txt_file: str) -> tuple[Body, urwid.Frame]:
 
 def initialize_application(
     txt_file: str, tasklist: Body, main_frame: urwid.Frame
-) -> tuple[Tasks, urwid.MainLoop, list[Optional[float]]]:
+) -> tuple[Tasks, urwid.MainLoop, list[Optional[bytes]]]:
     """
     Initialize the application components.
 
@@ -113,24 +118,28 @@ def initialize_application(
         main_frame: The main UI frame
 
     Returns:
-        Tuple of (tasks, loop, last_mod_time)
+        Tuple of (tasks, loop, last_hash)
     """
-    # Initialize Tasks to handle task manipulation
-    tasks = Tasks(txt_file)
+    # Share the tasklist's Tasks instance so sync and the UI use the same file cache
+    tasks = tasklist.tasks
     tasks.delete_expired_tasks()
     tasks.normalize_file(tasklist)
 
-    # Initialize the MainLoop
-    loop = urwid.MainLoop(main_frame, palette=PALETTE, handle_mouse=False)
+    # Initialize the MainLoop on asyncio: it keeps one selector with the terminal and the file
+    # watcher's pipe registered, where the default loop rebuilds its selector every iteration.
+    # Let urwid create the asyncio loop: it picks a selector loop (pipes need add_reader(),
+    # which the Windows default loop lacks) and closes it again on exit.
+    event_loop = urwid.AsyncioEventLoop()
+    loop = urwid.MainLoop(main_frame, palette=PALETTE, handle_mouse=False, event_loop=event_loop)
     tasklist.loop = loop  # type: ignore
 
     # Prepare to update the tasklist if the todo.txt file has changed outside the application
     try:
-        last_mod_time = [os.path.getmtime(txt_file)]
+        last_hash = [tasks.content_digest()]
     except FileNotFoundError:
-        last_mod_time = [None]
+        last_hash = [None]
 
-    return tasks, loop, last_mod_time
+    return tasks, loop, last_hash
 
 
 def run_application(
@@ -138,28 +147,37 @@ def run_application(
     loop: urwid.MainLoop,
     txt_file: str,
     tasklist: Body,
-    last_mod_time: list[Optional[float]],
+    last_hash: list[Optional[bytes]],
 ) -> None:
     """
-    Run the main application loop with periodic updates.
+    Run the main application loop, reloading the tasklist when the file changes.
 
     Args:
         tasks: Tasks instance for file operations
         loop: Urwid main loop
         txt_file: Path to the todo.txt file
         tasklist: The main tasklist Body widget
-        last_mod_time: List containing last modification time of the file
+        last_hash: List containing the digest of the file's last seen content
     """
-    # Set an alarm to check for file changes every 5 seconds
-    loop.set_alarm_in(
-        __sync_refresh_rate__, tasks.sync, (txt_file, tasklist, last_mod_time)
+    sync_args = (txt_file, tasklist, last_hash)
+
+    # Reload the tasklist when the file changes outside the application: through file
+    # notifications if watchdog is installed, otherwise by polling every few seconds
+    watcher = FileWatcher(
+        txt_file,
+        loop,
+        lambda snapshot: tasks.refresh_if_changed(*sync_args, snapshot=snapshot),
+        retry_delay=__sync_refresh_rate__,
+        load=tasks.load_snapshot,
     )
-
-    # Set an alarm to update focused task index every 1 second
-    loop.set_alarm_in(__track_focused_task_interval__, tasklist.track_focused_task)
+    if not watcher.start():
+        loop.set_alarm_in(__sync_refresh_rate__, tasks.sync, sync_args)
 
     # Start the MainLoop to display the application
-    loop.run()
+    try:
+        loop.run()
+    finally:
+        watcher.stop()
 
 
 def main() -> None:
@@ -179,10 +197,10 @@ def main() -> None:
     tasklist, main_frame = setup_ui_components(txt_file)
 
     # Initialize application
-    tasks, loop, last_mod_time = initialize_application(txt_file, tasklist, main_frame)
+    tasks, loop, last_hash = initialize_application(txt_file, tasklist, main_frame)
 
     # Run the application
-    run_application(tasks, loop, txt_file, tasklist, last_mod_time)
+    run_application(tasks, loop, txt_file, tasklist, last_hash)
 
 
 if __name__ == "__main__":
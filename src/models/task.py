@@ -3,12 +3,20 @@ Task data model and parsing logic.
 """
 
 import re
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
+from src.config.constants import PRIORITY_REGEX
 from src.utils.helpers import is_valid_date
 
 
+# Priority word, compiled once instead of per word in from_string()
+_PRIORITY_RE = re.compile(PRIORITY_REGEX)
+
+# Sort key stand-in for tasks without a due date
+_FAR_FUTURE = date(9999, 12, 31)
+
+
 @dataclass
 class Task:
     """
@@ -48,7 +56,6 @@ class Task:
         """
         # Import here to avoid circular imports
         from src.config.constants import (
-            PRIORITY_REGEX,
             DUE_DATE_REGEX,
             RECURRENCE_REGEX,
         )
@@ -90,7 +97,7 @@ class Task:
                 threshold_date = word[2:]  # Remove 't:' prefix
             elif word == "h:1":
                 hidden = True
-            elif re.match(PRIORITY_REGEX, word):
+            elif _PRIORITY_RE.match(word):
                 priority = word[1:-1]  # Remove parentheses
             elif is_valid_date(word):
                 task_dates.append(word)
@@ -185,7 +192,7 @@ class Task:
         due_date_key = (
             datetime.strptime(self.due_date, "%Y-%m-%d").date()
             if self.due_date
-            else datetime(9999, 12, 31).date()
+            else _FAR_FUTURE
         )
 
         # Create sort text without dates and completion markers
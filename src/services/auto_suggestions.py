@@ -2,54 +2,93 @@
 Auto-suggestions service for todo.txt contexts and projects.
 """
 
-import urwid
 import re
+from bisect import bisect_left
+
+import urwid
+
 from src.services.task_service import Tasks
 
+# Context/project tags, properly bounded by spaces or the ends of the line. The trailing
+# boundary is a lookahead so it doesn't swallow the space in front of an adjacent tag.
+_TAGS_RE = re.compile(r'(?:^| )([@+])([^ ]+)(?= |$)')
+
 
 class AutoSuggestions:
     """
     Handle auto suggesting projects and contexts.
     """
 
-    def __init__(self, txt_file):
+    def __init__(self, txt_file, tasks=None):
         """
         Initializes the AutoSuggestions instance.
 
         :param txt_file: Path to the todo.txt file.
+        :param tasks: Tasks instance to read the file through; one is created if not given.
         """
         self.txt_file = txt_file  # Set the file path
-        self.contexts = self.fetch_contexts()  # Fetch and set the contexts
-        self.projects = self.fetch_projects()  # Fetch and set the projects
+        self.tasks = tasks if tasks is not None else Tasks(txt_file)
+        self._cache_key = None  # Content digest of the file the tags below were read from
+        self.contexts = []
+        self.projects = []
+        # Lowercased copies of contexts/projects, aligned by index, for prefix lookups
+        self._contexts_lower = []
+        self._projects_lower = []
+        self.refresh_tags()  # Fetch and set the contexts and projects
+        self.last_suggestions = []  # Suggestions currently shown, with their @/+ symbol
         self.dialog = urwid.ListBox(urwid.SimpleFocusListWalker([]))  # Create an empty ListBox for suggestions
 
-    def fetch_contexts(self):
+    def invalidate(self):
+        """
+        Forces the next update_suggestions() call to re-read the tags from the file.
         """
-        Fetches unique context tags from the todo.txt file.
+        self._cache_key = None
 
-        :returns: A list of unique context tags.
+    def refresh_tags(self):
         """
-        contexts = set()  # Create an empty set to store unique context tags
-        tasks = Tasks(self.txt_file)  # Initialize Tasks
-        for task in tasks.read():  # Loop through all tasks
-            # Regex to find context tags, making sure they are properly bounded
-            for match in re.finditer(r'(^| )@([^ ]+)( |$)', task):
-                contexts.add(match.group(2))  # Add the context to the set
-        return list(contexts)  # Convert set to list and return
-
-    def fetch_projects(self):
+        Re-reads contexts and projects, but only if the file changed since the last read.
+
+        The lists are kept sorted (case-insensitive) so suggestions come out in order.
         """
-        Fetches unique project tags from the todo.txt file.
+        cache_key = self.tasks.content_digest()
+        if cache_key == self._cache_key:
+            return
+
+        contexts, projects = self.fetch_tags()
+        self.contexts = sorted(contexts, key=lambda item: (item.lower(), item))
+        self.projects = sorted(projects, key=lambda item: (item.lower(), item))
+        self._contexts_lower = [item.lower() for item in self.contexts]
+        self._projects_lower = [item.lower() for item in self.projects]
+        self._cache_key = cache_key
+
+    @staticmethod
+    def _items_with_prefix(items, items_lower, prefix):
+        """
+        Returns the items whose lowercased form starts with prefix (case-insensitive).
+
+        items_lower is sorted, so matches form one run starting at the bisect point.
+        """
+        prefix = prefix.lower()
+        start = end = bisect_left(items_lower, prefix)
+        while end < len(items_lower) and items_lower[end].startswith(prefix):
+            end += 1
+        return items[start:end]
 
-        :returns: A list of unique project tags.
+    def fetch_tags(self):
         """
-        projects = set()  # Create an empty set to store unique project tags
-        tasks = Tasks(self.txt_file)  # Initialize Tasks
-        for task in tasks.read():  # Loop through all tasks
-            # Regex to find project tags, making sure they are properly bounded
-            for match in re.finditer(r'(^| )\+([^ ]+)( |$)', task):
-                projects.add(match.group(2))  # Add the project to the set
-        return list(projects)  # Convert set to list and return
+        Fetches unique context and project tags from the todo.txt file in a single pass.
+
+        :returns: A tuple of (contexts, projects) sets.
+        """
+        contexts = set()  # Create empty sets to store unique context and project tags
+        projects = set()
+        for task in self.tasks.read():  # Loop through all tasks
+            for match in _TAGS_RE.finditer(task):
+                if match.group(1) == '@':
+                    contexts.add(match.group(2))  # Add the context to the set
+                else:
+                    projects.add(match.group(2))  # Add the project to the set
+        return contexts, projects
 
     def update_suggestions(self, current_word):
         """
@@ -57,30 +96,31 @@ class AutoSuggestions:
 
         :param current_word: The current word being typed by the user.
         """
-        # Refresh the contexts and projects each time this method is called
-        self.contexts = self.fetch_contexts()
-        self.projects = self.fetch_projects()
+        # Refresh the contexts and projects if the file changed since the last keystroke
+        self.refresh_tags()
 
         filtered = []  # Initialize empty list to store filtered suggestions
         color = ''  # Initialize color to empty string
 
         # If the current word starts with '@', suggest contexts
         if current_word.startswith("@"):
-            filtered = [item for item in self.contexts if item.lower().startswith(current_word[1:].lower())]
+            filtered = self._items_with_prefix(self.contexts, self._contexts_lower, current_word[1:])
             symbol = "@"  # Symbol to prepend to each suggestion
             color = 'context'  # Color for context suggestions
 
         # If the current word starts with '+', suggest projects
         elif current_word.startswith("+"):
-            filtered = [item for item in self.projects if item.lower().startswith(current_word[1:].lower())]
+            filtered = self._items_with_prefix(self.projects, self._projects_lower, current_word[1:])
             symbol = "+"  # Symbol to prepend to each suggestion
             color = 'project'  # Color for project suggestions
 
-        # Sort the filtered list alphabetically (case-insensitive)
-        filtered.sort(key=str.lower)
+        # No sorting needed: the contexts and projects are kept sorted (case-insensitive)
+
+        # Keep the suggestions (with the appropriate symbol prepended) for tab completion
+        self.last_suggestions = [symbol + item for item in filtered]
 
-        # Create a comma-separated string of suggestions with the appropriate symbol prepended
-        suggestions_str = ', '.join([symbol + item for item in filtered])
+        # Create a comma-separated string of the suggestions
+        suggestions_str = ', '.join(self.last_suggestions)
 
         # Create a Text widget for the suggestions and set its color
         suggestions_widget = urwid.Text((color, suggestions_str))
@@ -0,0 +1,181 @@
+"""
+File-change notifications for the todo.txt file.
+
+Uses watchdog (inotify/FSEvents/kqueue/ReadDirectoryChangesW) when it is installed, so
+outside edits show up immediately and the main loop sleeps while nothing happens. Without
+watchdog, start() returns False and the caller falls back to polling.
+"""
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+import urwid
+
+from src.services.task_service import is_racy
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional
+    FileSystemEventHandler = object
+    Observer = None
+
+
+# Events that mean the task file's content may have changed. Opens and read-only closes
+# (including the app's own reads) are left out, or every read would trigger another.
+_CHANGE_EVENT_TYPES = frozenset({"created", "modified", "moved", "deleted", "closed"})
+
+
+class _TaskFileEventHandler(FileSystemEventHandler):
+    """
+    Forwards events that touch the task file to a callback; runs on the observer thread.
+    """
+
+    def __init__(self, txt_file: str, notify: Callable[[], None]):
+        super().__init__()
+        self.txt_file = txt_file
+        self.notify = notify
+
+    def on_any_event(self, event) -> None:
+        if event.event_type not in _CHANGE_EVENT_TYPES:
+            return
+
+        # Editors often save by writing a temp file and renaming it over the original,
+        # so the task file may show up as the destination of a move
+        paths = (event.src_path, getattr(event, "dest_path", ""))
+        if any(path and os.path.realpath(path) == self.txt_file for path in paths):
+            self.notify()
+
+
+class FileWatcher:
+    """
+    Calls on_change on the urwid main loop whenever the task file changes on disk.
+    """
+
+    def __init__(
+        self,
+        txt_file: str,
+        loop: urwid.MainLoop,
+        on_change: Callable[[Any], bool],
+        retry_delay: float,
+        load: Callable[[], Any] | None = None,
+    ):
+        """
+        Parameters:
+        txt_file (str): Path to the todo.txt file to watch.
+        loop (urwid.MainLoop): The main loop on_change is run on.
+        on_change (callable): Called after the file changed with the latest result of load
+                              (None if there is none). Returns False if the change couldn't be
+                              applied yet (e.g. a dialog is open).
+        retry_delay (float): Seconds to wait before calling on_change again after it returned False.
+        load (callable): Optional. Called on the watcher thread when the file changed, so slow
+                         work like reading it doesn't block the UI. Must not touch urwid.
+        """
+        self.txt_file = os.path.realpath(txt_file)
+        self.loop = loop
+        self.on_change = on_change
+        self.retry_delay = retry_delay
+        self.load = load
+        self._observer = None
+        self._pipe_fd = None
+        self._retry_alarm = None
+        self._loaded = None  # Latest load() result not yet handed to on_change
+        self._loaded_key = None  # (inode, mtime_ns, size) of the file as of the last load()
+
+    @staticmethod
+    def available() -> bool:
+        """Whether file notifications are supported (watchdog is installed)."""
+        return Observer is not None
+
+    def start(self) -> bool:
+        """
+        Starts watching the task file's directory.
+
+        Returns False (and does nothing) if watchdog isn't installed or the watch can't be set up.
+        """
+        if not self.available():
+            return False
+
+        # Observer callbacks run on a background thread; urwid isn't thread-safe, so wake the
+        # main loop through a pipe it watches and handle the change there
+        self._pipe_fd = self.loop.watch_pipe(self._on_pipe_data)
+        handler = _TaskFileEventHandler(self.txt_file, self._notify)
+
+        observer = Observer()
+        observer.daemon = True
+        try:
+            observer.schedule(handler, os.path.dirname(self.txt_file), recursive=False)
+            observer.start()
+        except OSError:
+            # e.g. the inotify watch limit is reached; polling still works
+            self._close_pipe()
+            return False
+
+        self._observer = observer
+        return True
+
+    def stop(self) -> None:
+        """Stops the observer thread and releases the wake-up pipe."""
+        # Join the observer first so it can't write to the pipe after it's closed
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        self._close_pipe()
+        if self._retry_alarm is not None:
+            self.loop.remove_alarm(self._retry_alarm)
+            self._retry_alarm = None
+
+    def _close_pipe(self) -> None:
+        if self._pipe_fd is not None:
+            self.loop.remove_watch_pipe(self._pipe_fd)  # Closes the read end only
+            os.close(self._pipe_fd)
+            self._pipe_fd = None
+
+    def _notify(self) -> None:
+        # Observer thread: load ahead of the main loop, then wake it. A single byte is enough,
+        # bursts of events coalesce in the pipe.
+        if self.load is not None:
+            self._load_if_changed()
+        os.write(self._pipe_fd, b"\n")
+
+    def _load_if_changed(self) -> None:
+        # A single save usually raises several events (modify, close); only the first one
+        # for a given version of the file needs to read it. Inside the racy window a
+        # same-size rewrite can keep the key, so the file is read again there.
+        try:
+            stat = os.stat(self.txt_file)
+        except OSError:
+            return  # e.g. the file is mid-save; the main loop will read it itself
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if key == self._loaded_key and not is_racy(stat):
+            return
+
+        try:
+            loaded = self.load()
+        except (OSError, ValueError):
+            return
+        self._loaded_key = key
+        # Keep a newer result already waiting rather than replace it with nothing
+        if loaded is not None:
+            self._loaded = loaded
+
+    def _on_pipe_data(self, data: bytes) -> bool:
+        # Main loop thread: one call per batch of events; empty data means the pipe closed
+        if not data:
+            return False
+        self._apply_change()
+        return True  # Keep the pipe open
+
+    def _apply_change(self, loop=None, user_data=None) -> None:
+        # A newer event supersedes any pending retry
+        if self._retry_alarm is not None:
+            self.loop.remove_alarm(self._retry_alarm)
+            self._retry_alarm = None
+
+        # Not atomic: a result stored mid-swap is dropped, which only means on_change reads
+        # the file itself (its event's pipe byte still triggers another call)
+        loaded, self._loaded = self._loaded, None
+        if not self.on_change(loaded):
+            self._retry_alarm = self.loop.set_alarm_in(self.retry_delay, self._apply_change)
@@ -2,10 +2,14 @@
 Task service for CRUD operations and file management.
 """
 
+import functools
+import hashlib
 import os
 import re
+import tempfile
+import time
 import urwid
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from src.config.constants import (
     PRIORITY_REGEX,
@@ -18,6 +22,184 @@ from src.config.settings import PALETTE, setting_enabled
 from src.utils.helpers import is_valid_date
 from src.ui.widgets import TaskUI, CustomCheckBox
 
+# Precompiled patterns for the hot parsing paths
+_PRIORITY_RE = re.compile(PRIORITY_REGEX)
+_DUE_RE = re.compile(DUE_DATE_REGEX)
+_END_RE = re.compile(END_DATE_REGEX)
+_REC_RE = re.compile(RECURRENCE_REGEX)
+_THR_RE = re.compile(r"t:(\d{4}-\d{2}-\d{2})")
+_WS_RE = re.compile(r"\s+")
+_PRIO_PREFIX_RE = re.compile(r"^\([A-Z]\)")
+_REC_AMOUNT_RE = re.compile(r"\+?(\d+)")
+_NLP_DATE_RES = {
+    "due:": re.compile(r"due:([a-zA-Z0-9]+)"),
+    "end:": re.compile(r"end:([a-zA-Z0-9]+)"),
+}
+_NLP_RELATIVE_RE = re.compile(r"^[+]?[0-9]+[dwmy]$")
+_NLP_SHORT_RE = re.compile(r"\d{1,2}[a-zA-Z]{3}(\d{4})?$")
+_NLP_DAY_RE = re.compile(r"\d{1,2}")
+_NLP_MONTH_RE = re.compile(r"[a-zA-Z]{3}")
+_NLP_YEAR_RE = re.compile(r"\d{4}$")
+_WEEKDAY_TO_NUMBER = {
+    "mon": 0,
+    "tue": 1,
+    "wed": 2,
+    "thu": 3,
+    "fri": 4,
+    "sat": 5,
+    "sun": 6,
+}
+_MONTH_TO_NUMBER = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+# Sort key stand-in for tasks without a due date
+_FAR_FUTURE = date(9999, 12, 31)
+
+# A file modified less than this long ago may be rewritten again without a visible change to
+# its mtime (coarse timestamps) or size, so change checks confirm its cache entry by content
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Number of distinct search queries whose results are kept per file version
+_QUERY_RESULTS_LIMIT = 256
+
+# os.open() flags for appending to a task file
+_APPEND_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+
+
+def _replace_match(text, match, replacement):
+    """
+    Replace the span of a match object already found in text.
+
+    Cheaper than re.sub() when the match is already at hand, but only rewrites that one
+    occurrence: use it when the pattern matches nowhere else in text.
+    """
+    return text[: match.start()] + replacement + text[match.end() :]
+
+
+def _resolve_nlp_date(nlp_date, today):
+    """
+    Turn a lowercased natural-language date (tom, fri, nw, 3d, 15dec, ...) into a date.
+
+    Returns None if nlp_date isn't one of the supported forms.
+    """
+    if nlp_date in ("tod", "today"):
+        return today
+    if nlp_date in ("tom", "tomorrow"):
+        return today + timedelta(days=1)
+    if nlp_date in _WEEKDAY_TO_NUMBER:
+        days_until_target = (_WEEKDAY_TO_NUMBER[nlp_date] - today.weekday() + 7) % 7
+        if days_until_target == 0:
+            days_until_target = 7
+        return today + timedelta(days=days_until_target)
+    if nlp_date in ("nw", "nextweek"):
+        return today + timedelta((0 - today.weekday() + 7))
+    if nlp_date in ("nm", "nextmonth"):
+        if today.month == 12:
+            return today.replace(year=today.year + 1, month=1, day=1)
+        return today.replace(month=today.month + 1, day=1)
+    if _NLP_RELATIVE_RE.match(nlp_date):
+        num = int(nlp_date[:-1])
+        unit = nlp_date[-1]
+        if unit == "d":
+            return today + timedelta(days=num)
+        if unit == "w":
+            return today + timedelta(weeks=num)
+        if unit == "m":
+            return today + relativedelta(months=num)
+        return today + relativedelta(years=num)
+    if _NLP_SHORT_RE.match(nlp_date):
+        day = int(_NLP_DAY_RE.search(nlp_date).group(0))
+        month = _MONTH_TO_NUMBER.get(_NLP_MONTH_RE.search(nlp_date).group(0))
+        if month is None:
+            return None
+
+        year_match = _NLP_YEAR_RE.search(nlp_date)
+        year = int(year_match.group(0)) if year_match else today.year
+        if month < today.month or (month == today.month and day < today.day):
+            year += 1
+        return datetime(year, month, day).date()
+    return None
+
+
+def is_racy(stat):
+    """
+    Whether a file was modified so recently that a same-size rewrite could keep its mtime.
+
+    An unchanged (inode, mtime_ns, size) key doesn't prove such a file unchanged; its content
+    has to be checked again.
+    """
+    return time.time_ns() - stat.st_mtime_ns < _RACY_WINDOW_NS
+
+
+def _write_file(path, text, flags):
+    """
+    Write text to path in one go, bypassing the text-mode encoder and buffering.
+
+    os.write() may write less than requested, so keep going until everything is out.
+    Returns the file's stat after the write, taken from the open descriptor.
+    """
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, flags, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+        return os.fstat(fd)
+    finally:
+        os.close(fd)
+
+
+def _replace_file(path, text):
+    """
+    Replace the contents of path with text atomically: write a temp file next to it, then
+    rename it over the original. Readers (sync, other editors, the file watcher) see either
+    the old or the new file, never a half-written one, and a crash can't truncate the list.
+
+    Symlinks are followed so the link itself survives. The file's permission bits are kept,
+    but other metadata of the old inode is not: hard links to it are split off, and the owner
+    becomes the current user.
+
+    Returns the stat of the new file, taken from the open descriptor.
+    """
+    path = os.path.realpath(path)
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o644
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        data = memoryview(text.encode("utf-8"))
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            os.chmod(tmp_path, mode)  # os.fchmod() is Unix-only before Python 3.13
+            os.fsync(fd)  # The data must be on disk before the rename makes it the task file
+            stat = os.fstat(fd)  # Renaming keeps the inode, size and mtime
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+        return stat
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
 
 class Tasks:
     """
@@ -27,53 +209,293 @@ class Tasks:
 
     def __init__(self, txt_file):
         self.txt_file = txt_file
+        # Last read task lines, keyed by the file's (inode, mtime_ns, size)
+        self._cache_key = None
+        self._cache_lines = None
+        # blake2b of the cached content
+        self._cache_hash = None
+        # Whether the cached content ended with "\n" (kept on rewrites, and needed to extend the
+        # cache after appends). A lone "\r" doesn't count: an appended "\n" joins it into one
+        # "\r\n" line break.
+        self._cache_ends_with_newline = False
+        # Normalized task -> line indexes, built lazily from the cached lines
+        self._norm_index = None
+        # (lowercased lines, trigram -> line indexes) for search, built lazily from the cached lines
+        self._search_index = None
+        # (lowercased query, matching line indexes) of the last search against that index
+        self._last_search = None
+        # Lowercased query -> matching line indexes, for queries repeated against that index
+        self._query_results = {}
 
     # Reads task lines from the file and returns them as a list
     def read(self):
-        with open(self.txt_file, "r") as f:
-            return [line.strip() for line in f.readlines()]
+        self._refresh_cache()
+        return self._cache_lines[:]
+
+    # Returns a digest of the file's current content. With verify, a file modified too
+    # recently for its stat to prove it unchanged is re-hashed (for change checks).
+    def content_digest(self, verify: bool = False) -> bytes:
+        self._refresh_cache(verify)
+        return self._cache_hash.digest()
+
+    # Reads and parses the task file without touching the cache, so it can run off the UI
+    # thread. Returns None if the cache already holds the file's current content.
+    def load_snapshot(self):
+        stat = os.stat(self.txt_file)
+        if (stat.st_ino, stat.st_mtime_ns, stat.st_size) == self._cache_key and not is_racy(stat):
+            return None
+
+        with open(self.txt_file, "rb") as f:
+            data = f.read()
+        content = data.decode("utf-8")
+        return (
+            stat,
+            hashlib.blake2b(data, digest_size=16),
+            self._split_lines(content),
+            content.endswith("\n"),
+        )
+
+    # Makes a load_snapshot() result the cached state, unless the file changed again since.
+    # Must run on the UI thread, like every other use of the cache.
+    def install_snapshot(self, snapshot):
+        stat, content_hash, lines, ends_with_newline = snapshot
+        try:
+            current = os.stat(self.txt_file)
+        except FileNotFoundError:
+            return
+        cache_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if (current.st_ino, current.st_mtime_ns, current.st_size) != cache_key:
+            return  # Outdated; the next read() picks up the newer content itself
+
+        # Same bytes as cached: keep the parsed lines and indexes
+        if self._cache_hash is None or content_hash.digest() != self._cache_hash.digest():
+            self._cache_lines = lines
+            self._cache_ends_with_newline = ends_with_newline
+            self._norm_index = None
+            self._search_index = None
+
+        self._cache_key = cache_key
+        self._cache_hash = content_hash
+
+    # Brings the cached lines up to date with the file
+    def _refresh_cache(self, verify=False):
+        stat = os.stat(self.txt_file)
+        cache_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        # Only hit the disk again if the file changed since the last read. Plain reads trust
+        # an unchanged key; change checks (verify) also re-hash a file modified too recently
+        # for an unchanged key to prove it is still the same.
+        if cache_key == self._cache_key and not (verify and is_racy(stat)):
+            return
+
+        with open(self.txt_file, "rb") as f:
+            data = f.read()
+        content_hash = hashlib.blake2b(data, digest_size=16)
+
+        # Same bytes as cached (touched, or a re-check): keep the parsed lines and indexes
+        if self._cache_hash is None or content_hash.digest() != self._cache_hash.digest():
+            content = data.decode("utf-8")
+            self._cache_lines = self._split_lines(content)
+            self._cache_ends_with_newline = content.endswith("\n")
+            self._norm_index = None
+            self._search_index = None
+
+        self._cache_key = cache_key
+        self._cache_hash = content_hash
+
+    # Splits file content into stripped task lines, like text-mode readlines()
+    @staticmethod
+    def _split_lines(content):
+        # Apply universal newlines, as text-mode reads did
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+        lines = content.split("\n")
+
+        # A trailing newline does not start another line
+        if lines[-1] == "":
+            lines.pop()
+
+        return [line.strip() for line in lines]
+
+    # Replaces the file contents with the given task lines, ending them with a newline if
+    # trailing_newline is set (and there is anything to end)
+    def _write_all(self, lines, trailing_newline=False):
+        content = "\n".join(lines)
+        if trailing_newline and lines:
+            content += "\n"
+        content_hash = hashlib.blake2b(content.encode("utf-8"), digest_size=16)
+
+        # Leave the file alone if it already holds exactly this, e.g. when normalizing an
+        # already normalized file at startup or when no task expired
+        try:
+            if self.content_digest() == content_hash.digest():
+                return
+        except FileNotFoundError:
+            pass
+
+        stat = _replace_file(self.txt_file, content)
+
+        # Keep the cache warm with what we just wrote, split exactly as read() would
+        self._store_cache(
+            self._split_lines(content), content.endswith("\n"), content_hash, stat
+        )
+
+    # Records lines we just wrote ourselves (hashed by content_hash) as the cached state of the
+    # file, keyed by the stat taken right after the write. Reads trust that key even inside the
+    # racy window; only change checks look at the content again.
+    def _store_cache(self, lines, ends_with_newline, content_hash, stat):
+        self._cache_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        self._cache_lines = lines
+        self._cache_ends_with_newline = ends_with_newline
+        self._cache_hash = content_hash
+        self._norm_index = None
+        self._search_index = None
+
+    # Returns the task lines along with an index of where each normalized task occurs
+    def _read_normalized_index(self):
+        tasks = self.read()
+
+        # Normalize every line once per file version instead of once per lookup
+        if self._norm_index is None:
+            norm_index = {}
+            for i, task in enumerate(tasks):
+                norm_index.setdefault(self.normalize_task(task), []).append(i)
+            self._norm_index = norm_index
+
+        return tasks, self._norm_index
+
+    # Returns the lowercased task lines and a trigram -> line indexes map over them
+    def _read_search_index(self):
+        tasks = self.read()
+
+        # Index every line once per file version instead of scanning all lines per keystroke
+        if self._search_index is None:
+            lowered = [task.lower() for task in tasks]
+            trigrams = {}
+            for i, text in enumerate(lowered):
+                for trigram in {text[j : j + 3] for j in range(len(text) - 2)}:
+                    trigrams.setdefault(trigram, set()).add(i)
+            self._search_index = (lowered, trigrams)
+            # Earlier results' line indexes refer to the previous file version
+            self._last_search = None
+            self._query_results = {}
+
+        return tasks, self._search_index
+
+    # Returns the task lines containing query, ignoring case
+    def matching_tasks(self, query):
+        tasks, (lowered, trigrams) = self._read_search_index()
+        query = query.lower()
+
+        # Queries repeated on the same file version (e.g. the priority quick filters) are free
+        matches = self._query_results.get(query)
+        if matches is None:
+            if self._last_search is not None and query.startswith(self._last_search[0]):
+                # Narrowing the last query (typing on): only its matches can still match
+                matches = [i for i in self._last_search[1] if query in lowered[i]]
+            elif len(query) < 3:
+                # Too short to have a trigram: fall back to a scan of the lowercased lines
+                matches = [i for i, text in enumerate(lowered) if query in text]
+            else:
+                matches = self._trigram_matches(query, lowered, trigrams)
+
+            # Typing yields a new query per keystroke; start over rather than grow without bound
+            if len(self._query_results) >= _QUERY_RESULTS_LIMIT:
+                self._query_results.clear()
+            self._query_results[query] = matches
+
+        self._last_search = (query, matches)
+        return [tasks[i] for i in matches]
+
+    # Returns the sorted indexes of the lowercased lines containing query (3+ characters)
+    @staticmethod
+    def _trigram_matches(query, lowered, trigrams):
+        # Only lines containing every trigram of the query can match; intersect smallest first
+        candidate_sets = []
+        for trigram in {query[j : j + 3] for j in range(len(query) - 2)}:
+            lines = trigrams.get(trigram)
+            if not lines:
+                return []
+            candidate_sets.append(lines)
+        candidate_sets.sort(key=len)
+        candidates = candidate_sets[0].intersection(*candidate_sets[1:])
+
+        return [i for i in sorted(candidates) if query in lowered[i]]
+
+    # Returns the index of the first line exactly matching task_text, or None
+    @staticmethod
+    def _find_line(tasks, task_text):
+        try:
+            return tasks.index(task_text)
+        except ValueError:
+            return None
+
+    # Parses a task line into a dictionary of its components.
+    # Memoized per line, so the dict is shared between calls and must be treated as read-only.
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _parse_task(task_text):
+        # Substring checks are far cheaper than a regex scan and rule out most tasks
+        priority_match = (
+            _PRIORITY_RE.search(task_text) if "(" in task_text else None
+        )
+        due_date_match = _DUE_RE.search(task_text) if "due:" in task_text else None
+        completed = task_text.startswith("x ")
+        recurrence_match = (
+            _REC_RE.search(task_text) if "rec:" in task_text else None
+        )
+
+        if completed:
+            task_text = task_text[2:]
+
+        due_date = due_date_match.group(1) if due_date_match else None
+
+        # Threshold date for hideTasksWithThresholdDates; an impossible date counts as none
+        threshold_date = None
+        if "t:" in task_text:
+            threshold_match = _THR_RE.search(task_text)
+            if threshold_match:
+                try:
+                    threshold_date = date.fromisoformat(threshold_match.group(1))
+                except ValueError:
+                    pass
+
+        return {
+            "text": task_text,
+            "priority": priority_match.group(1) if priority_match else None,
+            "due_date": due_date,
+            # DUE_DATE_REGEX already guarantees YYYY-MM-DD, so the C-level ISO parser can replace strptime
+            "due_date_obj": date.fromisoformat(due_date) if due_date else None,
+            "completed": completed,
+            "recurrence": recurrence_match.group(1) if recurrence_match else None,
+            # Lowercased once here so search filtering doesn't redo it on every render
+            "text_lower": task_text.lower(),
+            # Display filters, precomputed so rendering doesn't rescan the text
+            "hidden": "h:1" in task_text,
+            "threshold_date": threshold_date,
+        }
 
     # Sorts a list of tasks based on due date, priority, and text
     @staticmethod
     def sort(tasks):
-        def parse(task_text):
-            priority_match = re.search(PRIORITY_REGEX, task_text)
-            due_date_match = re.search(DUE_DATE_REGEX, task_text)
-            completed = task_text.startswith("x ")
-            recurrence_match = re.search(RECURRENCE_REGEX, task_text)
-
-            if completed:
-                task_text = task_text[2:]
-
-            return {
-                "text": task_text,
-                "priority": priority_match.group(1) if priority_match else None,
-                "due_date": due_date_match.group(1) if due_date_match else None,
-                "completed": completed,
-                "recurrence": recurrence_match.group(1) if recurrence_match else None,
-            }
+        parse = Tasks._parse_task
 
         def get_sort_key(task):
-            # Convert due_date to a date object for proper sorting, default to a date far in the future if None
-            due_date_key = (
-                datetime.strptime(task["due_date"], "%Y-%m-%d").date()
-                if task["due_date"]
-                else datetime(9999, 12, 31).date()
-            )
-
-            sort_text = ""
+            # Sort by the parsed due date, default to a date far in the future if None
+            due_date_key = task["due_date_obj"] or _FAR_FUTURE
+
             words = task["text"].split()
 
-            for index, word in enumerate(words):
-                if index == 0 and word == "x":
-                    continue
-                elif is_valid_date(word.strip()):
-                    continue
-                else:
-                    sort_text += word + " "
+            # Skip the completion marker and dates; join once instead of concatenating per word
+            sort_words = [
+                word
+                for index, word in enumerate(words)
+                if not (index == 0 and word == "x") and not is_valid_date(word)
+            ]
 
-            # Remove trailing whitespace and convert to lowercase for case-insensitive sorting
-            sort_text = sort_text.strip().lower()
+            # Convert to lowercase for case-insensitive sorting
+            sort_text = " ".join(sort_words).lower()
 
             return (due_date_key, sort_text)
 
@@ -86,8 +508,9 @@ class Tasks:
         return parsed_tasks
 
     # Do not allow adding duplicate tasks
-    def task_already_exists(self, task_text):
-        existing_tasks = self.read()
+    def task_already_exists(self, task_text, existing_tasks=None):
+        if existing_tasks is None:
+            existing_tasks = self.read()
         return task_text in existing_tasks
 
     # Adds a new task to the task file
@@ -98,19 +521,25 @@ class Tasks:
         # Convert NLP dates to actual dates
         normalized_task = self.convert_nlp_to_dates(normalized_task)
 
-        # Check if the file is empty
-        file_is_empty = False
-        try:
-            file_is_empty = os.path.getsize(self.txt_file) == 0
-        except FileNotFoundError:
-            file_is_empty = True  # File doesn't exist, so consider it as empty
+        # Read the file once for both the duplicate check and the cache update below
+        existing_tasks = self.read()
+
+        # Check if the file is empty, using the size read() just got from os.stat
+        file_is_empty = self._cache_key[2] == 0
 
         # Append the new task to the file
-        if not self.task_already_exists(normalized_task):
-            with open(self.txt_file, "a") as f:
-                if not file_is_empty:
-                    f.write("\n")
-                f.write(normalized_task)
+        if not self.task_already_exists(normalized_task, existing_tasks):
+            appended = ("" if file_is_empty else "\n") + normalized_task
+            stat = _write_file(self.txt_file, appended, _APPEND_FLAGS)
+
+            # We know exactly what the file holds now, so keep the cache warm for the
+            # refresh below instead of re-reading it (a trailing newline adds a blank line)
+            if self._cache_ends_with_newline:
+                existing_tasks.append("")
+            existing_tasks.append(normalized_task)
+            content_hash = self._cache_hash.copy()
+            content_hash.update(appended.encode("utf-8"))
+            self._store_cache(existing_tasks, False, content_hash, stat)
 
         keymap_instance.refresh_displayed_tasks()
         keymap_instance.focus_on_specific_task(normalized_task.strip())
@@ -136,18 +565,15 @@ class Tasks:
         normalized_new_task = self.convert_nlp_to_dates(normalized_new_task)
 
         # Read all tasks from the file
-        with open(self.txt_file, "r") as f:
-            tasks = f.readlines()
+        tasks, norm_index = self._read_normalized_index()
 
         # Find the task to be edited and replace it with the new task
-        for i, task in enumerate(tasks):
-            if self.normalize_task(task.strip()) == normalized_old_task:
-                tasks[i] = normalized_new_task + "\n"
-                break
+        matches = norm_index.get(normalized_old_task)
+        if matches:
+            tasks[matches[0]] = normalized_new_task
 
-        # Write the updated tasks back to the file
-        with open(self.txt_file, "w") as f:
-            f.writelines(tasks)
+        # Write the updated tasks back to the file, keeping a trailing newline if it had one
+        self._write_all(tasks, trailing_newline=self._cache_ends_with_newline)
 
         # Restructure the updated task components
         restructured_task = self.restructure_task_components(normalized_new_task)
@@ -160,24 +586,19 @@ class Tasks:
         normalized_task = self.normalize_task(task_text)
 
         # Read all tasks from the file
-        with open(self.txt_file, "r") as f:
-            tasks = f.readlines()
+        tasks, norm_index = self._read_normalized_index()
 
         # Filter out the task to be deleted
-        tasks = [
-            task
-            for task in tasks
-            if self.normalize_task(task.strip()) != normalized_task
-        ]
+        doomed = set(norm_index.get(normalized_task, ()))
+        tasks = [task for i, task in enumerate(tasks) if i not in doomed]
 
-        # Write the remaining tasks back to the file
-        with open(self.txt_file, "w") as f:
-            f.writelines(tasks)
+        # Write the remaining tasks back to the file, keeping a trailing newline if it had one
+        self._write_all(tasks, trailing_newline=self._cache_ends_with_newline)
 
     # Postpone task to tomorrow
     def postpone_to_tomorrow(self, task_text):
         # Search for the due date in task_text
-        due_date_match = re.search(DUE_DATE_REGEX, task_text)
+        due_date_match = _DUE_RE.search(task_text)
         if not due_date_match:
             return  # Return if no due date is found
 
@@ -196,23 +617,26 @@ class Tasks:
                 today_dt, datetime.min.time()
             ) + timedelta(days=1)
 
-        # Replace the original due date with the new one
+        # Replace the original due date with the new one: splice it into the matched span,
+        # or rewrite every due date if the task has more than one
         new_due_date_str = datetime.strftime(new_due_date_dt, "%Y-%m-%d")
-        updated_task = re.sub(DUE_DATE_REGEX, f"due:{new_due_date_str}", task_text)
+        replacement = f"due:{new_due_date_str}"
+        if _DUE_RE.search(task_text, due_date_match.end()) is None:
+            updated_task = _replace_match(task_text, due_date_match, replacement)
+        else:
+            updated_task = _DUE_RE.sub(replacement, task_text)
 
         # Read all tasks from the file
-        with open(self.txt_file, "r") as f:
-            tasks = f.readlines()
+        tasks = self.read()
 
         # Find the task to be edited and replace it with the new task
-        for i, task in enumerate(tasks):
-            if task.strip() == task_text:
-                tasks[i] = updated_task + "\n"
-                break
+        index = self._find_line(tasks, task_text)
+        if index is None:
+            return None  # Not in the file (anymore): nothing to write
+        tasks[index] = updated_task
 
-        # Write the updated tasks back to the file
-        with open(self.txt_file, "w") as f:
-            f.writelines(tasks)
+        # Write the updated tasks back to the file, keeping a trailing newline if it had one
+        self._write_all(tasks, trailing_newline=self._cache_ends_with_newline)
 
         return updated_task
 
@@ -225,11 +649,13 @@ class Tasks:
         modified_tasks = []
         recurring_tasks = []
 
-        # Flag to check if a task has been toggled (completed/uncompleted)
-        task_toggled = False
+        # Locate the task to toggle (completed/uncompleted) once, up front
+        toggle_index = self._find_line(tasks, task_text)
 
-        # Current date of completion (today's date)
-        completion_date = datetime.now().date()
+        # Current date of completion (today's date), captured once for the whole pass
+        now = datetime.now()
+        completion_date = now.date()
+        today_str = now.strftime("%Y-%m-%d")
 
         for i, task in enumerate(tasks):
             # Remove leading and trailing whitespaces
@@ -238,11 +664,8 @@ class Tasks:
             # Check if the task is already complete
             is_complete = text.startswith("x ")
 
-            # Check if the modified task text matches the provided task_text
-            if text == task_text and not task_toggled:
-                # Set the flag to True
-                task_toggled = True
-
+            # Check if this is the task matching the provided task_text
+            if i == toggle_index:
                 # Toggle the task's completed state
                 if is_complete:
                     modified_task = text[
@@ -263,7 +686,7 @@ class Tasks:
                             modified_task = modified_task[10:]
 
                 else:
-                    has_priority = bool(re.match(r"^\([A-Z]\)", text[0:3]))
+                    has_priority = bool(_PRIO_PREFIX_RE.match(text[0:3]))
                     priority = text[0:3]
 
                     if setting_enabled("enableCompletionAndCreationDates"):
@@ -272,36 +695,36 @@ class Tasks:
                                 "x "
                                 + priority
                                 + " "
-                                + datetime.now().strftime("%Y-%m-%d")
-                                + re.sub(r"^\([A-Z]\)", "", text)
+                                + today_str
+                                + _PRIO_PREFIX_RE.sub("", text)
                             )
                         else:
                             modified_task = (
-                                "x " + datetime.now().strftime("%Y-%m-%d") + " " + text
+                                "x " + today_str + " " + text
                             )
                     else:
                         modified_task = "x " + text
 
                 # Remove any extra white spaces
-                modified_tasks.append(re.sub(r"\s+", " ", modified_task).strip())
+                modified_tasks.append(_WS_RE.sub(" ", modified_task).strip())
 
                 # Handle recurring tasks
                 if "rec:" in text and not is_complete:
                     # Extract recurrence value
-                    recurrence_value = re.search(RECURRENCE_REGEX, text).group(1)
+                    recurrence_value = _REC_RE.search(text).group(1)
 
                     # Check if the recurrence is strict (starts with '+')
                     is_strict = recurrence_value.startswith("+")
 
                     # Extract old due date and threshold date if present
-                    due_date_match = re.search(DUE_DATE_REGEX, text)
+                    due_date_match = _DUE_RE.search(text)
                     old_due_date = (
                         datetime.strptime(due_date_match.group(1), "%Y-%m-%d").date()
                         if due_date_match
                         else None
                     )
 
-                    threshold_date_match = re.search(r"t:(\d{4}-\d{2}-\d{2})", text)
+                    threshold_date_match = _THR_RE.search(text)
                     old_threshold_date = (
                         datetime.strptime(
                             threshold_date_match.group(1), "%Y-%m-%d"
@@ -311,18 +734,21 @@ class Tasks:
                     )
 
                     # Calculate new due date based on recurrence
-                    amount_match = re.match(r"\+?(\d+)", recurrence_value)
+                    amount_match = _REC_AMOUNT_RE.match(recurrence_value)
                     if not amount_match:
                         continue
                     amount = int(amount_match.group(1))
                     unit = recurrence_value[-1]
-                    unit_mapping = {
-                        "d": "days",
-                        "w": "weeks",
-                        "m": "months",
-                        "y": "years",
-                    }
-                    delta = relativedelta(**{unit_mapping[unit]: amount})
+                    # Days and weeks are fixed lengths, so plain timedelta is enough;
+                    # only months and years need relativedelta's calendar arithmetic
+                    if unit == "d":
+                        delta = timedelta(days=amount)
+                    elif unit == "w":
+                        delta = timedelta(weeks=amount)
+                    elif unit == "m":
+                        delta = relativedelta(months=amount)
+                    else:
+                        delta = relativedelta(years=amount)
 
                     if is_strict:
                         new_due_date = old_due_date + delta if old_due_date else None
@@ -333,7 +759,7 @@ class Tasks:
                         new_due_date = completion_date + delta
                         if old_threshold_date and old_due_date:
                             days_difference = (old_due_date - old_threshold_date).days
-                            new_threshold_date = new_due_date - relativedelta(
+                            new_threshold_date = new_due_date - timedelta(
                                 days=days_difference
                             )
                         else:
@@ -351,18 +777,35 @@ class Tasks:
                         else ""
                     )
 
-                    # Create new task with updated dates
+                    # Create new task with updated dates. If each date occurs once, splice
+                    # them into the spans already matched on text (rightmost first so earlier
+                    # offsets stay valid); otherwise rewrite every occurrence with sub()
+                    date_replacements = [
+                        (pattern, match, replacement)
+                        for pattern, match, replacement in (
+                            (_DUE_RE, due_date_match, new_due_date_str),
+                            (_THR_RE, threshold_date_match, new_threshold_date_str),
+                        )
+                        if match
+                    ]
                     new_task = text
-                    if due_date_match:
-                        new_task = re.sub(DUE_DATE_REGEX, new_due_date_str, new_task)
-                    elif new_due_date_str:
-                        new_task += f" {new_due_date_str}"
+                    if all(
+                        pattern.search(text, match.end()) is None
+                        for pattern, match, _ in date_replacements
+                    ):
+                        for _, match, replacement in sorted(
+                            date_replacements,
+                            key=lambda item: item[1].start(),
+                            reverse=True,
+                        ):
+                            new_task = _replace_match(new_task, match, replacement)
+                    else:
+                        for pattern, _, replacement in date_replacements:
+                            new_task = pattern.sub(replacement, new_task)
 
-                    if threshold_date_match:
-                        new_task = re.sub(
-                            r"t:(\d{4}-\d{2}-\d{2})", new_threshold_date_str, new_task
-                        )
-                    elif new_threshold_date_str:
+                    if not due_date_match and new_due_date_str:
+                        new_task += f" {new_due_date_str}"
+                    if not threshold_date_match and new_threshold_date_str:
                         new_task += f" {new_threshold_date_str}"
 
                     has_priority = False
@@ -383,15 +826,11 @@ class Tasks:
                     # Add new creation date if setting is enabled
                     if setting_enabled("enableCompletionAndCreationDates"):
                         if not has_priority:
-                            new_task = (
-                                datetime.now().strftime("%Y-%m-%d") + " " + new_task
-                            )
+                            new_task = today_str + " " + new_task
                         else:
                             priority = new_task[:4]
                             text = new_task[3:]
-                            new_task = (
-                                priority + datetime.now().strftime("%Y-%m-%d") + text
-                            )
+                            new_task = priority + today_str + text
 
                     # Add the new task to recurring_tasks if it doesn't already exist
                     if not self.task_already_exists(new_task):
@@ -401,36 +840,36 @@ class Tasks:
                 modified_tasks.append(text)
 
         # Write the updated tasks back to the file
-        with open(self.txt_file, "w") as f:
-            f.write("\n".join(modified_tasks + recurring_tasks))
+        self._write_all(modified_tasks + recurring_tasks)
 
     # Archives completed tasks to a 'done.txt' file and removes them from the original file
     def archive(self):
         completed_tasks = []
         incomplete_tasks = []
 
-        # Read all tasks from the file
-        with open(self.txt_file, "r") as f:
-            tasks = f.readlines()
+        # Read all tasks (already split and stripped, and usually cached)
+        tasks = self.read()
 
         # Separate tasks into completed and incomplete lists
         for task in tasks:
             if task.startswith("x "):
-                completed_tasks.append(task.strip())
+                completed_tasks.append(task)
             else:
-                incomplete_tasks.append(task.strip())
+                incomplete_tasks.append(task)
 
         # Append completed tasks to 'done.txt'
         done_txt_file = os.path.join(os.path.dirname(self.txt_file), "done.txt")
-        with open(done_txt_file, "a") as f:
-            f.write("\n".join(completed_tasks) + "\n")
+        _write_file(done_txt_file, "\n".join(completed_tasks) + "\n", _APPEND_FLAGS)
 
         # Write only incomplete tasks back to the original task file
-        with open(self.txt_file, "w") as f:
-            f.write("\n".join(incomplete_tasks))
+        self._write_all(incomplete_tasks)
 
-    # Format a single task line by splitting the task into its components
-    def restructure_task_components(self, task):
+    # Format a single task line by splitting the task into its components.
+    # The result depends only on the task string, so it is memoized: normalize_file()
+    # runs after every add/edit and mostly sees lines it has already restructured.
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def restructure_task_components(task):
         """
         Before: Go +zzzProject to @aContext [YouTube](https://youtube.com) and watch rec:+1d a video. +anotherProject due:2023-01-01 @work
         After: Go to [YouTube](https://youtube.com) and watch a video. +anotherProject +zzzProject @aContext @work due:2023-01-01 rec:+1d
@@ -452,26 +891,33 @@ class Tasks:
         words = task.split()
 
         for index, word in enumerate(words):
+            # Dispatch on the first character so each word costs a comparison or two
+            first = word[0]
             if index == 0 and word == "x":
                 complete = True
                 continue
-            elif word.startswith("+"):
+            elif first == "+":
                 projects.append(word)
-            elif word.startswith("@"):
+            elif first == "@":
                 contexts.append(word)
-            elif word.startswith("due:"):
+            elif first == "d" and word.startswith("due:"):
                 due_date = word
-            elif word.startswith("end:"):
+            elif first == "e" and word.startswith("end:"):
                 end_date = word
-            elif word.startswith("rec:"):
+            elif first == "r" and word.startswith("rec:"):
                 rec_rule = word
-            elif word.startswith("t:"):  # Check for threshold date
+            elif first == "t" and word.startswith("t:"):  # Check for threshold date
                 threshold_date = word
-            elif is_valid_date(word.strip()):
+            elif "0" <= first <= "9" and is_valid_date(word):
                 task_text_dates.append(word)
-            elif re.match(r"^\([A-Z]\)", word):
+            elif (
+                first == "("
+                and len(word) >= 3
+                and word[2] == ")"
+                and "A" <= word[1] <= "Z"
+            ):  # Same as matching ^\([A-Z]\)
                 priority = word
-            elif word == "h:1":
+            elif first == "h" and word == "h:1":
                 hidden_tag = word
             else:
                 task_text.append(word)
@@ -532,20 +978,21 @@ class Tasks:
 
     # Normalizes the entire task file
     def normalize_file(self, body=None):
-        # Read all tasks from the file
-        with open(self.txt_file, "r") as f:
-            tasks = f.readlines()
+        # Read all tasks from the file (read() already strips each line)
+        tasks = self.read()
 
         # Remove extra spaces, filter out empty lines, and restructure tasks
         normalized_tasks = [
-            self.restructure_task_components(task.strip())
+            self.restructure_task_components(task)
             for task in tasks
-            if task.strip()
+            if task
         ]
 
         # Write the normalized tasks back to the file
-        with open(self.txt_file, "w") as f:
-            f.write("\n".join(normalized_tasks))
+        self._write_all(normalized_tasks)
+
+        # Build the search index now, at startup, rather than on the first search keystroke
+        self._read_search_index()
 
         # Refresh the task list display if a Body instance is provided
         if body is not None:
@@ -560,22 +1007,17 @@ class Tasks:
             search_query  # Update the current search query
         )
 
-        # Create a Tasks instance for the given file path
-        tasks = Tasks(txt_file)
+        # Reuse the tasklist's Tasks instance so the file cache carries over between keystrokes
+        tasks = tasklist_instance.tasks
 
-        # Read all tasks and filter those that match the search query
-        filtered_tasks = [
-            task for task in tasks.read() if search_query.lower() in task.lower()
-        ]
+        # Read all tasks and filter those that match the search query (via the trigram index)
+        filtered_tasks = tasks.matching_tasks(search_query)
 
-        # Update the UI to display only the filtered tasks
-        tasklist_instance.body = urwid.SimpleFocusListWalker(
-            [
-                w
-                for w, _ in TaskUI.render_and_display_tasks(
-                    tasks.sort(filtered_tasks), PALETTE
-                ).contents
-            ]
+        # Update the UI to display only the filtered tasks, patching the existing walker in
+        # place so only rows entering or leaving the results are touched
+        TaskUI.update_walker(
+            tasklist_instance.body,
+            TaskUI.build_task_widgets(tasks.sort(filtered_tasks), PALETTE),
         )
 
         # If 'Enter' was the last key pressed, refocus on the task list in the UI
@@ -591,89 +1033,25 @@ class Tasks:
 
     # Convert natural language like due:tomorrow or end:tomorrow to actual dates
     def convert_nlp_to_dates(self, task):
+        # Resolve relative dates against a single "today" for both prefixes
+        today = datetime.now().date()
+
         def convert_date(task, prefix):
-            date_match = re.search(rf"{prefix}([a-zA-Z0-9]+)", task)
-            if not date_match:
+            if prefix not in task:
                 return task
 
-            nlp_date = date_match.group(1).lower()
-            today = datetime.now().date()
-            weekday_to_number = {
-                "mon": 0,
-                "tue": 1,
-                "wed": 2,
-                "thu": 3,
-                "fri": 4,
-                "sat": 5,
-                "sun": 6,
-            }
-
-            if nlp_date in ["tod", "today"]:
-                new_date = today
-            elif nlp_date in ["tom", "tomorrow"]:
-                new_date = today + timedelta(days=1)
-            elif nlp_date in weekday_to_number.keys():
-                target_weekday = weekday_to_number[nlp_date]
-                days_until_target = (target_weekday - today.weekday() + 7) % 7
-                new_date = today + timedelta(days=days_until_target)
-                if days_until_target == 0:
-                    new_date += timedelta(days=7)
-            elif nlp_date in ["nw", "nextweek"]:
-                new_date = today + timedelta((0 - today.weekday() + 7))
-            elif nlp_date in ["nm", "nextmonth"]:
-                if today.month == 12:
-                    new_date = today.replace(year=today.year + 1, month=1, day=1)
-                else:
-                    new_date = today.replace(month=today.month + 1, day=1)
-            elif re.match(r"^[+]?[0-9]+[dwmy]$", nlp_date):
-                num = int(nlp_date[:-1])
-                unit = nlp_date[-1]
-                if unit == "d":
-                    new_date = today + timedelta(days=num)
-                elif unit == "w":
-                    new_date = today + timedelta(weeks=num)
-                elif unit == "m":
-                    new_date = today + relativedelta(months=num)
-                elif unit == "y":
-                    new_date = today + relativedelta(years=num)
-            elif re.match(r"\d{1,2}[a-zA-Z]{3}(\d{4})?$", nlp_date):
-                day_match = re.search(r"\d{1,2}", nlp_date)
-                month_match = re.search(r"[a-zA-Z]{3}", nlp_date)
-                year_match = re.search(r"\d{4}$", nlp_date)
-
-                if day_match and month_match:
-                    day = int(day_match.group(0))
-                    month_str = month_match.group(0)
-
-                    month_to_number = {
-                        "jan": 1,
-                        "feb": 2,
-                        "mar": 3,
-                        "apr": 4,
-                        "may": 5,
-                        "jun": 6,
-                        "jul": 7,
-                        "aug": 8,
-                        "sep": 9,
-                        "oct": 10,
-                        "nov": 11,
-                        "dec": 12,
-                    }
-                    month = month_to_number.get(month_str.lower())
-                    if month is None:
-                        return task
-
-                    year = int(year_match.group(0)) if year_match else today.year
-                    if month < today.month or (
-                        month == today.month and day < today.day
-                    ):
-                        year += 1
-                    new_date = datetime(year, month, day).date()
-            else:
-                return task
+            # The first match decides the date. As before, every match of the prefix
+            # gets that date, or the task is left alone if the first one isn't a date.
+            resolved = []
+
+            def replace(match):
+                if not resolved:
+                    resolved.append(_resolve_nlp_date(match.group(1).lower(), today))
+                if resolved[0] is None:
+                    return match.group(0)
+                return f"{prefix}{resolved[0].strftime('%Y-%m-%d')}"
 
-            actual_date = f"{prefix}{new_date.strftime('%Y-%m-%d')}"
-            return re.sub(rf"{prefix}[a-zA-Z0-9]+", actual_date, task)
+            return _NLP_DATE_RES[prefix].sub(replace, task)
 
         task = convert_date(task, "due:")
         task = convert_date(task, "end:")
@@ -690,7 +1068,7 @@ class Tasks:
         remaining = []
 
         for task in tasks:
-            end_match = re.search(r"end:(\d{4}-\d{2}-\d{2})", task)
+            end_match = _END_RE.search(task)
             if not end_match:
                 remaining.append(task)
                 continue
@@ -699,28 +1077,41 @@ class Tasks:
             if end_date >= today:
                 remaining.append(task)
 
-        with open(self.txt_file, "w") as f:
-            f.write("\n".join(remaining))
+        self._write_all(remaining)
 
-    # Checks for updates in the task file and refreshes the UI if needed
-    def sync(self, loop, user_data):
+    # Checks for updates in the task file and refreshes the UI if needed.
+    # Returns False if the check has to be retried later (dialog open, file briefly missing).
+    def refresh_if_changed(self, txt_file, tasklist_instance, last_hash, snapshot=None):
         import src.main as main_module
 
-        # Unpack user data to get file path, UI instance, and last modification time
-        txt_file, tasklist_instance, last_mod_time = user_data
+        # Content already read and parsed off the UI thread (see load_snapshot()). Safe to
+        # install even while a dialog is open; it only saves the read below.
+        if snapshot is not None:
+            self.install_snapshot(snapshot)
 
         # Check if a dialog is currently open in the UI; if so, skip the update
         if isinstance(tasklist_instance.main_frame.contents["body"][0], urwid.Overlay):
-            # Reschedule to run this method after 5 seconds
-            loop.set_alarm_in(__sync_refresh_rate__, self.sync, user_data)
-            return
+            return False
+
+        # Fingerprint the task file's content. This is a stat while the cache is known good,
+        # and catches rewrites that keep the mtime, which mtime checks alone would miss. An
+        # installed snapshot was just hashed, so it needs no second look.
+        # If the file is briefly missing (mid-save), try again later.
+        try:
+            digest = self.content_digest(verify=snapshot is None)
+        except FileNotFoundError:
+            return False
 
-        # Get the current modification time of the task file
-        current_mod_time = os.path.getmtime(txt_file)
+        # Check if the task file's content changed since the last check. Our own writes
+        # change it too, so only rebuild if the lines differ from what is displayed.
+        if digest != last_hash[0]:
+            lines = self._cache_lines[:]  # Just brought up to date, no need to stat again
+            last_hash[0] = digest
+            if lines == tasklist_instance.displayed_lines:
+                return True
 
-        # Check if the task file has been modified since the last check
-        if current_mod_time != last_mod_time[0]:
             # Save the currently focused task in the UI
+            tasklist_instance.track_focused_task()
             focused_widget = tasklist_instance.focus
             focused_task_text = None
 
@@ -730,8 +1121,8 @@ class Tasks:
             ):
                 focused_task_text = focused_widget.original_widget.original_text
 
-            # Refresh the task list UI
-            tasklist_instance.refresh_displayed_tasks()
+            # Refresh the task list UI from the lines we just read
+            tasklist_instance.refresh_displayed_tasks(lines)
 
             # Refocus on the previously focused task in the UI based on its original text
             if focused_task_text:
@@ -739,12 +1130,11 @@ class Tasks:
                     main_module.__focused_task_index__
                 )
 
-            # Update the last known modification time
-            last_mod_time[0] = current_mod_time
+        return True
 
-        # Reschedule this method to run again after 5 seconds
-        loop.set_alarm_in(
-            __sync_refresh_rate__,
-            self.sync,
-            (txt_file, tasklist_instance, last_mod_time),
-        )
+    # Polls the task file for updates (used when file notifications aren't available)
+    def sync(self, loop, user_data):
+        self.refresh_if_changed(*user_data)
+
+        # Reschedule this method to run again after __sync_refresh_rate__ seconds
+        loop.set_alarm_in(__sync_refresh_rate__, self.sync, user_data)
@@ -7,18 +7,30 @@ import re
 import os
 import subprocess
 import platform
-from datetime import date, datetime, timedelta
+import time
+from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
 from src.config.constants import (
     STRIP_X_FROM_TASK, PRIORITY_REGEX, DUE_DATE_REGEX, RECURRENCE_REGEX,
-    __track_focused_task_interval__
+    __search_debounce_delay__, __refresh_coalesce_delay__
 )
-from src.config.settings import PALETTE, COLORS, SETTINGS, setting_enabled
+from src.config.settings import PALETTE, COLORS, setting_enabled, toggle_setting
 from src.utils.helpers import debug, is_valid_date
 from src.services.task_service import Tasks
 from src.ui.widgets import CustomCheckBox, TaskUI
 from src.services.auto_suggestions import AutoSuggestions
 
+# Command that hands a URL to the desktop's default handler, resolved once for this OS
+_URL_OPENER = {
+    'Linux': ['xdg-open'],
+    'Darwin': ['open'],
+    'Windows': ['cmd', '/c', 'start', ''],
+}.get(platform.system())
+
+# Link patterns for extract_task_links()
+_MD_LINK_RE = re.compile(r'\[([^\]]*?)\]\(([^)]*?)\)')
+_PLAIN_LINK_RE = re.compile(r'(https?://[^\s\)]+|file://[^\s\)]+|term:[^\s\)]+)')
+
 
 class Body(urwid.ListBox):
     """
@@ -29,8 +41,6 @@ class Body(urwid.ListBox):
     def __init__(self, txt_file):
         # File path for the task file
         self.txt_file = txt_file
-        # Initialize AutoSuggestions object
-        self.auto_suggestions = AutoSuggestions(self.txt_file)
         # Will hold the main frame of the UI
         self.main_frame = None
         # Will hold any decorations around the task list
@@ -39,40 +49,39 @@ class Body(urwid.ListBox):
         self.tasklist_instance = self
         # Will hold pending URL choices if multiple URLs are present in a task
         self.pending_url_choice = None
-        # Initialize Tasks object
+        # Initialize the Tasks object shared by the whole UI, so its file cache is reused
         self.tasks = Tasks(txt_file)
+        # Initialize AutoSuggestions object, reading tags through the shared Tasks object
+        self.auto_suggestions = AutoSuggestions(self.txt_file, self.tasks)
         # Helpers to detect double keypresses, e.g. `gg` for go to top
         self.last_key = None
         self.last_key_time = None
+        # Task text -> row in self.body, for refocusing a task without scanning the list
+        self._text_to_body_idx = {}
+        self._indexed_body = None  # The walker _text_to_body_idx was built for
+        # Pending coalesced refresh (see _schedule_refresh()) and the task to refocus after it
+        self._refresh_alarm = None
+        self._pending_refresh_focus = None
 
-        # Determine the OS type for URL opening
-        self.os_type = platform.system()
-
-        # Another Tasks object to help with initialization
-        tasks = Tasks(txt_file)
+        # Task lines behind the current display, so sync can skip rebuilding unchanged content
+        self.displayed_lines = self.tasks.read()
 
         # Initialize the ListBox with sorted tasks
         import src.main as main_module
-        rendered_tasks = TaskUI.render_and_display_tasks(tasks.sort(tasks.read()), PALETTE, main_module.__current_search_query__)
-        widgets = [w for w, _ in rendered_tasks.contents]
+        widgets = TaskUI.build_task_widgets(self.tasks.sort(self.displayed_lines), PALETTE, main_module.__current_search_query__)
         super(Body, self).__init__(urwid.SimpleFocusListWalker(widgets))
+        self._index_body()
 
     def toggle_display_hidden_tasks_setting(self):
         """
         Toggles the 'displayHiddenTasksByDefault' setting.
         """
-        global SETTINGS
-        for i, setting in enumerate(SETTINGS):
-            if setting[0] == 'displayHiddenTasksByDefault':
-                current_value = setting[1].lower() == 'true'
-                new_value = 'false' if current_value else 'true'
-                SETTINGS[i] = ('displayHiddenTasksByDefault', new_value)
-                break
+        toggle_setting('displayHiddenTasksByDefault')
 
     def open_url_or_terminal(self, url):
         """
         Opens a URL in browser or executes a terminal command based on prefix.
-        term: prefix opens Ghostty with the command, otherwise uses xdg-open.
+        term: prefix opens Ghostty with the command, otherwise uses the OS's default opener.
         """
         if url.startswith('term:'):
             command = url[5:].strip()  # Remove 'term:' prefix
@@ -88,18 +97,14 @@ class Body(urwid.ListBox):
                 stderr=subprocess.STDOUT,
                 start_new_session=True,
             )
-        else:
-            if self.os_type == 'Linux':
-                subprocess.Popen(
-                    ['xdg-open', url],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.STDOUT,
-                    start_new_session=True,
-                )
-            elif self.os_type == 'Windows':
-                subprocess.run(['start', url], shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
-            elif self.os_type == 'Darwin':
-                subprocess.run(['open', url], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+        elif _URL_OPENER is not None:
+            # Popen rather than run so a slow browser launch doesn't block the UI
+            subprocess.Popen(
+                _URL_OPENER + [url],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
 
     def extract_task_links(self, task_line):
         """Extracts markdown link destinations and plain URLs from a task line."""
@@ -108,7 +113,7 @@ class Body(urwid.ListBox):
             return []
 
         # Markdown: [text](destination) - allow spaces in destination; stop at first ')'
-        md_matches = list(re.finditer(r'\[([^\]]*?)\]\(([^)]*?)\)', task_line))
+        md_matches = list(_MD_LINK_RE.finditer(task_line))
         links = []
 
         for m in md_matches:
@@ -121,23 +126,77 @@ class Body(urwid.ListBox):
         for m in reversed(md_matches):
             stripped_line = stripped_line[:m.start()] + ' ' + stripped_line[m.end():]
 
-        plain_links = re.findall(r'(https?://[^\s\)]+|file://[^\s\)]+|term:[^\s\)]+)', stripped_line)
+        plain_links = _PLAIN_LINK_RE.findall(stripped_line)
         links.extend(plain_links)
 
         return links
 
-    def refresh_displayed_tasks(self):
+    def refresh_displayed_tasks(self, lines=None):
         # Refresh the displayed tasks by reading and sorting tasks again
-        tasks = Tasks(self.txt_file)
+        # (self.tasks caches the file, so this is free if nothing changed).
+        # Callers that already hold the current lines can pass them in.
+        # This refresh covers any coalesced one still waiting
+        if self._refresh_alarm is not None:
+            self.loop.remove_alarm(self._refresh_alarm)
+            self._refresh_alarm = None
+        tasks = self.tasks
+        if lines is None:
+            lines = tasks.read()
+        # Rows that were edited, completed or deleted won't be shown again, so drop their widgets
+        if lines is not self.displayed_lines:
+            TaskUI.evict_cached_widgets(set(self.displayed_lines).difference(lines))
+        self.displayed_lines = lines
         # Update the ListBox body with newly sorted tasks
         import src.main as main_module
-        rendered_tasks = TaskUI.render_and_display_tasks(tasks.sort(tasks.read()), PALETTE, main_module.__current_search_query__)
-        widgets = [w for w, _ in rendered_tasks.contents]
-        self.body = urwid.SimpleFocusListWalker(widgets)
-        # Update the main frame body to reflect the new task list (only if initialized)
-        if self.main_frame is not None:
+        widgets = TaskUI.build_task_widgets(tasks.sort(lines), PALETTE, main_module.__current_search_query__)
+        # Patch the existing walker so only added, removed or changed rows are touched
+        TaskUI.update_walker(self.body, widgets)
+        self._index_body()
+        # The tasks may have changed, so let the next suggestion lookup re-read the tags
+        self.auto_suggestions.invalidate()
+        # Put the task list back into the main frame if a dialog replaced it (only if initialized).
+        # Re-assigning an unchanged body would just invalidate the whole frame for a redraw.
+        if self.main_frame is not None and self.main_frame.body is not self.tasklist_decorations:
             self.main_frame.contents['body'] = (self.tasklist_decorations, None)
 
+    def _schedule_refresh(self, focus_task):
+        """
+        Refreshes the task list and refocuses focus_task shortly, so a burst of keypresses
+        (e.g. a held toggle key) refreshes once instead of once per press.
+        """
+        self._pending_refresh_focus = focus_task
+        loop = getattr(self, 'loop', None)
+        if loop is None:
+            self._run_scheduled_refresh()
+        elif self._refresh_alarm is None:
+            self._refresh_alarm = loop.set_alarm_in(__refresh_coalesce_delay__, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self, loop=None, user_data=None):
+        self._refresh_alarm = None
+        self.refresh_displayed_tasks()
+        self.focus_on_specific_task(self._pending_refresh_focus)
+
+    def _index_body(self):
+        """
+        Rebuilds the task text -> row lookup used by focus_on_specific_task().
+        """
+        text_to_idx = {}
+        for i, widget in enumerate(self.body):
+            checkbox = getattr(widget, 'original_widget', None)
+            if isinstance(checkbox, CustomCheckBox):
+                text_to_idx.setdefault(checkbox.original_text, i)  # First occurrence wins, as with a scan
+        self._text_to_body_idx = text_to_idx
+        self._indexed_body = self.body
+
+    def _row_text(self, i):
+        """
+        Returns the original text of the task at row i, or None if it isn't a task row.
+        """
+        if i >= len(self.body):
+            return None
+        checkbox = getattr(self.body[i], 'original_widget', None)
+        return checkbox.original_text if isinstance(checkbox, CustomCheckBox) else None
+
     def focus_on_specific_task(self, task=None):
         """
         Set focus on specific task either based on its index or text content
@@ -155,20 +214,23 @@ class Body(urwid.ListBox):
                     # If the index is out of range, do nothing or handle it differently
                     pass
             elif isinstance(task, str):  # If task is a string, treat it as the task text
-                for i, widget in enumerate(self.body):
-                    if hasattr(widget, 'original_widget') and \
-                            isinstance(widget.original_widget, CustomCheckBox) and \
-                            widget.original_widget.original_text == task:
-                        self.set_focus(i)
-                        break
+                # The lookup covers the walker as last indexed; search() patches it without re-indexing
+                i = self._text_to_body_idx.get(task) if self._indexed_body is self.body else None
+                if i is None or self._row_text(i) != task:
+                    # Stale or missing entry: re-index the current rows and look again
+                    self._index_body()
+                    i = self._text_to_body_idx.get(task)
+                if i is not None:
+                    self.set_focus(i)
         else:
             # Focus on the topmost task if no task is specified
             self.set_focus(1)
 
-    def track_focused_task(self, loop, user_data):
+    def track_focused_task(self):
         """
-        Constantly updates the __focused_task_index/text__ global so we know which task is
-        in focus at all times for easier task interaction throughout
+        Updates the __focused_task_index/text__ globals from the current focus, so key
+        handlers and sync know which task to act on. Called when they need it (at the start
+        of every keypress and before a sync refresh) instead of on a timer.
         """
         # Import global variables from main module
         import src.main as main_module
@@ -190,13 +252,13 @@ class Body(urwid.ListBox):
             main_module.__focused_task_index__ = None
             main_module.__focused_task_text__ = None
 
-        loop.set_alarm_in(__track_focused_task_interval__,
-                          self.track_focused_task)  # Schedule the next update in 1 second
-
     def keypress(self, size, key):
         # Import global variables from main module
         import src.main as main_module
 
+        # Let the handlers below act on whatever is focused right now
+        self.track_focused_task()
+
         # Dict: Qickly filter (search) tasks by priority SHIFT + [1-9]
         key_mapping_filter_priority = {
             '!': '(A)',
@@ -226,13 +288,13 @@ class Body(urwid.ListBox):
         #    '=': None
         #}
 
-        # Get the current time for detecting rapid keypresses
-        current_time = datetime.now()
+        # Get the current time for detecting rapid keypresses (monotonic: cheap and immune to clock changes)
+        current_time = time.monotonic()
 
         # Check if a key was pressed recently
         if self.last_key is not None:
             # Calculate the time difference between the last and current keypress
-            time_difference = (current_time - self.last_key_time).total_seconds()
+            time_difference = current_time - self.last_key_time
             # If two 'g' keys are pressed quickly, go to the top
             if time_difference < .3:
                 if self.last_key == 'g' and key == 'g':
@@ -308,9 +370,13 @@ class Body(urwid.ListBox):
         # Postpone the currently focused task to tomorrow
         elif key == 'P':
             focused_widget = self.focus
-            if focused_widget is not None:
+            if focused_widget is not None and \
+                    isinstance(getattr(focused_widget, 'original_widget', None), CustomCheckBox):
                 task_text = focused_widget.original_widget.original_text
-                task_text = Tasks.postpone_to_tomorrow(self, task_text)
+                # Tasks without a due date are left as they are (postpone returns None)
+                postponed_task = self.tasks.postpone_to_tomorrow(task_text)
+                if postponed_task is not None:
+                    task_text = postponed_task
                 self.refresh_displayed_tasks()
                 self.focus_on_specific_task(task_text)
 
@@ -372,8 +438,7 @@ class Body(urwid.ListBox):
         # Toggle 'displayHiddenTasksByDefault' setting
         elif key == 'h':
             self.toggle_display_hidden_tasks_setting()
-            self.refresh_displayed_tasks()
-            self.focus_on_specific_task(main_module.__focused_task_text__)
+            self._schedule_refresh(main_module.__focused_task_text__)
 
         # Quickly sort list by priority
         if key in key_mapping_filter_priority:
@@ -408,19 +473,11 @@ class Body(urwid.ListBox):
 
         # Toggle 'hideTasksWithThresholdDates' setting and refresh display
         elif key == 't':
-            global SETTINGS
-            # Find and toggle the 'hideTasksWithThresholdDates' setting
-            for i, setting in enumerate(SETTINGS):
-                if setting[0] == 'hideTasksWithThresholdDates':
-                    current_value = setting[1].lower() == 'true'
-                    new_value = 'false' if current_value else 'true'
-                    SETTINGS[i] = ('hideTasksWithThresholdDates', new_value)
-                    break
-
-            # Refresh displayed tasks
-            self.refresh_displayed_tasks()
-            # Refocus on the current task
-            self.focus_on_specific_task(main_module.__focused_task_text__)
+            # Toggle the 'hideTasksWithThresholdDates' setting
+            toggle_setting('hideTasksWithThresholdDates')
+
+            # Refresh displayed tasks and refocus on the current task (once per burst of presses)
+            self._schedule_refresh(main_module.__focused_task_text__)
 
         # Pass the keypress event to the parent class if no match is found
         else:
@@ -432,12 +489,60 @@ class Search(urwid.Edit):
     Extension of urwid.Edit to serve as search field for filtering tasks
     """
 
-    def __init__(self, tasklist_instance, *args, **kwargs):
+    def __init__(self, tasklist_instance, *args, on_search=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.tasklist_instance = tasklist_instance
+        # Called with the new query whenever the search text changes
+        self.on_search = on_search
+        # Debounce state: the pending alarm handle and the query it will run with
+        self._search_alarm = None
+        self._pending_query = None
+        self._typing = False
+        urwid.connect_signal(self, 'change', self._on_change)
+
+    def _on_change(self, edit_widget, search_query):
+        if self.on_search is None:
+            return
+
+        # Text set programmatically (quick filters, reset) applies right away and replaces
+        # whatever was typed before, so a pending search for that is dropped, not run
+        loop = getattr(self.tasklist_instance, 'loop', None)
+        if not self._typing or loop is None:
+            self._cancel_pending_search()
+            self.on_search(search_query)
+            return
+
+        # Typed text: restart the timer so a burst of keystrokes filters only once
+        if self._search_alarm is not None:
+            loop.remove_alarm(self._search_alarm)
+        self._pending_query = search_query
+        self._search_alarm = loop.set_alarm_in(__search_debounce_delay__, self._run_pending_search)
+
+    def _run_pending_search(self, loop=None, user_data=None):
+        self._search_alarm = None
+        query, self._pending_query = self._pending_query, None
+        if query is not None:
+            self.on_search(query)
+
+    def _cancel_pending_search(self):
+        if self._search_alarm is not None:
+            self.tasklist_instance.loop.remove_alarm(self._search_alarm)
+            self._search_alarm = None
+        self._pending_query = None
+
+    def flush_pending_search(self):
+        """
+        Runs a debounced search right away if one is waiting.
+        """
+        query = self._pending_query
+        self._cancel_pending_search()
+        if query is not None:
+            self.on_search(query)
 
     def keypress(self, size, key):
         if key == 'enter':
+            # Make sure the list reflects everything typed before leaving the field
+            self.flush_pending_search()
             self.tasklist_instance.main_frame.focus_position = 'body'
 
             # Set focus on topmost task if search results !empty
@@ -449,4 +554,8 @@ class Search(urwid.Edit):
                 self.tasklist_instance.set_focus(1)
             return
 
-        super().keypress(size, key)
+        self._typing = True
+        try:
+            super().keypress(size, key)
+        finally:
+            self._typing = False
@@ -1,9 +1,50 @@
-import urwid
+import difflib
+import functools
 import re
-from datetime import datetime
+from collections import OrderedDict
+from datetime import date, datetime
+
+import urwid
+
 from src.config.settings import COLORS, setting_enabled
 from src.utils.helpers import is_valid_date
 
+# Patterns used on every render
+_MD_LINK_RE = re.compile(r"\[([^\]]*?)\]\(([^)]*?)\)")
+_URL_RE = re.compile(r"(https?://\S+|file://\S+|term:\S+)")
+# First characters a word must start with for _URL_RE to match it
+_URL_FIRST_CHARS = frozenset("hft")
+# Colors for words that start with a COLORS key (due:..., http...), looked up by word[:4].
+# Keys longer than four characters can never equal word[:4], so leave them out.
+_COLOR_BY_PREFIX = {key: color for key, color in COLORS.items() if len(key) <= 4}
+
+
+@functools.lru_cache(maxsize=16384)
+def _word_color(word):
+    """
+    Classify a single word of an incomplete task.
+
+    Returns (color, is_url); is_url marks plain links, which get a [n] counter when a task has
+    several. Words repeat a lot across tasks (contexts, projects, dates), so this is memoized.
+    Dispatches on the first character so most words only take one or two checks.
+    """
+    first = word[0]
+    if first == "@":
+        return "context", False
+    if first == "+":
+        return "project", False
+    if word == "h:1" or (first == "t" and word.startswith("t:")):
+        return "is_complete", False
+    if word in COLORS:
+        return COLORS[word], False
+    if first in _URL_FIRST_CHARS and _URL_RE.match(word):
+        return "is_link", True
+    if word[:4] in _COLOR_BY_PREFIX:
+        return _COLOR_BY_PREFIX[word[:4]], False
+    if is_valid_date(word):
+        return "is_complete", False
+    return "text", False
+
 
 class CustomCheckBox(urwid.CheckBox):
     """
@@ -42,11 +83,86 @@ class TaskUI:
     Handle UI components like displaying the actual task list and the add/edit dialog and so on
     """
 
-    # Display the list of tasks inside the "Tasks" area
+    # Rendered task widgets keyed by (task text, completed, hide dates, occurrence), reused across
+    # rebuilds. The occurrence counts earlier copies of the same line in a build, so duplicate
+    # lines each get their own widget and a ListBox never holds one widget twice.
+    # Least recently used first; trimmed to the limit after each build, but never below what
+    # that build used, so a list longer than the limit doesn't throw its own rows away.
+    _widget_cache = OrderedDict()
+    _WIDGET_CACHE_LIMIT = 8192
+
+    # Most rows update_walker() diffs with difflib; a bigger change just replaces the span
+    _WALKER_DIFF_LIMIT = 2000
+
+    # Drops cached widgets (every copy) for task lines that are no longer in the file
+    @staticmethod
+    def evict_cached_widgets(task_lines):
+        for line in task_lines:
+            completed = line.startswith("x ")
+            text = line[2:] if completed else line
+            for hide_dates in (True, False):
+                occurrence = 0
+                while (text, completed, hide_dates, occurrence) in TaskUI._widget_cache:
+                    del TaskUI._widget_cache[(text, completed, hide_dates, occurrence)]
+                    occurrence += 1
+
+    # Identifies a widget for update_walker(): task rows are reused from the widget cache, so
+    # they compare by identity; headings and dividers are rebuilt each time, so compare by content
     @staticmethod
-    def render_and_display_tasks(tasks, palette, current_search_query=""):
+    def _walker_key(widget):
+        if isinstance(widget, urwid.Divider):
+            return "divider"
+        if isinstance(widget, urwid.Text):
+            return ("heading", widget.text)
+        return id(widget)
+
+    # Turns the contents of walker into widgets, touching only the rows that differ
+    @staticmethod
+    def update_walker(walker, widgets):
+        old_keys = [TaskUI._walker_key(widget) for widget in walker]
+        new_keys = [TaskUI._walker_key(widget) for widget in widgets]
+
+        # Most refreshes change a row or two: skip the unchanged head and tail in linear time
+        start = 0
+        shorter = min(len(old_keys), len(new_keys))
+        while start < shorter and old_keys[start] == new_keys[start]:
+            start += 1
+        old_end, new_end = len(old_keys), len(new_keys)
+        while (
+            old_end > start
+            and new_end > start
+            and old_keys[old_end - 1] == new_keys[new_end - 1]
+        ):
+            old_end -= 1
+            new_end -= 1
+
+        if old_end == start and new_end == start:
+            return  # Nothing changed
+
+        # A single edited row or a plain insertion/deletion leaves nothing to match, and
+        # difflib can go quadratic on a large span, so replace those spans outright
+        if (
+            min(old_end, new_end) - start <= 1
+            or (old_end - start) + (new_end - start) > TaskUI._WALKER_DIFF_LIMIT
+        ):
+            walker[start:old_end] = widgets[start:new_end]
+            return
+
+        # Diff what's left. Repeated keys (dividers) are real rows here, not junk to skip.
+        opcodes = difflib.SequenceMatcher(
+            None, old_keys[start:old_end], new_keys[start:new_end], autojunk=False
+        ).get_opcodes()
+
+        # Apply from the end so the indexes of the earlier opcodes stay valid
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag != "equal":
+                walker[start + i1 : start + i2] = widgets[start + j1 : start + j2]
+
+    # Build the headings and task widgets for the task list
+    @staticmethod
+    def build_task_widgets(tasks, palette, current_search_query=""):
         """
-        Renders and displays tasks in the terminal UI.
+        Builds the list of widgets (headings, dividers and task checkboxes) for the task list.
 
         Parameters:
         tasks (list)
@@ -54,7 +170,7 @@ class TaskUI:
         current_search_query (str): Current search query for filtering tasks.
 
         Returns:
-        urwid.Pile: A urwid Pile widget containing the rendered tasks.
+        list: The widgets, ready to be placed in a list walker.
         """
 
         # Initialize the list to hold UI widgets for each task
@@ -65,34 +181,33 @@ class TaskUI:
         first_heading = True
 
         # Get today's date for comparison with task due dates
-        today = datetime.today().date()
+        today = date.today()
+
+        # Settings and the query don't change while rendering, so look them up once.
+        # The rendered words depend on hide_dates, so it is part of the widget cache key.
+        hide_dates = setting_enabled("hideCompletionAndCreationDates")
+        hide_hidden_tasks = not setting_enabled("displayHiddenTasksByDefault")
+        hide_threshold_tasks = setting_enabled("hideTasksWithThresholdDates")
+        query = current_search_query.lower() if current_search_query else None
+
+        # (task text, completed) -> copies of that line already placed in this build
+        occurrences = {}
 
         # Loop through each task
         for task in tasks:
             # Skip tasks that don't match the current search query
-            if (
-                current_search_query
-                and current_search_query.lower() not in task["text"].lower()
-            ):
+            if query and query not in task["text_lower"]:
                 continue
 
             # Check for hidden tasks based on the setting
-            if "h:1" in task["text"] and not setting_enabled(
-                "displayHiddenTasksByDefault"
-            ):
+            if hide_hidden_tasks and task["hidden"]:
                 continue
 
-            # Check for hideTasksWithThresholdDates setting
-            if setting_enabled("hideTasksWithThresholdDates"):
-                threshold_date_match = re.search(r"t:(\d{4}-\d{2}-\d{2})", task["text"])
-                if threshold_date_match:
-                    threshold_date_str = threshold_date_match.group(1)
-                    threshold_date = datetime.strptime(
-                        threshold_date_str, "%Y-%m-%d"
-                    ).date()
-                    # Skip task if threshold date is in the future
-                    if threshold_date > today:
-                        continue
+            # Check for hideTasksWithThresholdDates setting: skip tasks whose threshold date is in the future
+            if hide_threshold_tasks:
+                threshold_date = task["threshold_date"]
+                if threshold_date and threshold_date > today:
+                    continue
 
             # Extract the due date from the current task
             due_date = task["due_date"]
@@ -100,9 +215,7 @@ class TaskUI:
             # Check if we're entering a new due date section
             if due_date != current_due_date:
                 current_due_date = due_date
-                due_date_obj = (
-                    datetime.strptime(due_date, "%Y-%m-%d") if due_date else None
-                )
+                due_date_obj = task["due_date_obj"]
 
                 # Create section heading based on due date
                 if due_date_obj:
@@ -112,11 +225,11 @@ class TaskUI:
                     heading_str = "No due date"
 
                 # Color the heading based on its relation to today's date
-                if due_date_obj and due_date_obj.date() < today:
+                if due_date_obj and due_date_obj < today:
                     heading_text = urwid.Text(
                         ("heading_overdue", heading_str + " (Overdue)")
                     )
-                elif due_date_obj and due_date_obj.date() == today:
+                elif due_date_obj and due_date_obj == today:
                     heading_text = urwid.Text(
                         ("heading_today", heading_str + " (Today)")
                     )
@@ -131,91 +244,23 @@ class TaskUI:
                 widgets.append(heading_text)
                 first_heading = False
 
-            # Prepare the task line for display
-            task_line = task["text"].strip()
-            is_task_complete = task["completed"]  # Determine if the task is complete
-            display_text = []
-
-            # Handle Markdown links and replace them with placeholders.
-            # Note: we allow spaces in the destination for custom schemes like
-            # [label](term:some command with args)
-            md_matches = list(re.finditer(r"\[([^\]]*?)\]\(([^)]*?)\)", task_line))
-            md_links = [(m.group(1), m.group(2)) for m in md_matches]
-            total_md_links = len(md_links)
-            for i, m in reversed(list(enumerate(md_matches))):
-                task_line = task_line[: m.start()] + f"MDLINK{i}" + task_line[m.end() :]
-
-            # Count the number of plain text links
-            total_plain_links = len(
-                re.findall(r"(https?://\S+|file://\S+|term:\S+)", task_line)
-            )
-
-            # Decide if we should count links based on the total number of Markdown and plain text links
-            should_count_links = (total_md_links + total_plain_links) > 1
-
-            # Split the task text into words
-            task_words = task_line.split()
-            link_counter = 0  # Initialize the link counter for each task
-
-            # Loop through each word to apply color-coding logic
-            for index, word in enumerate(task_words):
-                color = "is_complete" if is_task_complete else "text"
-
-                if setting_enabled("hideCompletionAndCreationDates"):
-                    if index == 0 and is_valid_date(word):
-                        continue
-
-                    if index == 1 and is_valid_date(word):
-                        continue
-
-                    if index == 2 and is_valid_date(word):
-                        continue
+            # Reuse the widget from a previous render if this task hasn't changed
+            line_key = (task["text"], task["completed"])
+            occurrence = occurrences.get(line_key, 0)
+            occurrences[line_key] = occurrence + 1
+            cache_key = (task["text"], task["completed"], hide_dates, occurrence)
+            cached_widget = TaskUI._widget_cache.get(cache_key)
+            if cached_widget is not None:
+                TaskUI._widget_cache.move_to_end(cache_key)
+                widgets.append(cached_widget)
+                continue
 
-                # Apply color-coding based on the word's prefix or content
-                if not is_task_complete:
-                    if word == "h:1":
-                        color = "is_complete"
-                    elif word.startswith("t:"):
-                        color = "is_complete"
-                    elif word.startswith("@"):
-                        color = "context"
-                    elif word.startswith("+"):
-                        color = "project"
-                    elif word in COLORS:
-                        color = COLORS[word]
-                    elif re.match(r"(https?://\S+|file://\S+|term:\S+)", word):
-                        color = "is_link"
-                        if should_count_links:
-                            link_counter += 1
-                            display_text.append((color, word))
-                            display_text.append(("is_link", f" [{link_counter}]"))
-                            display_text.append(("text", " "))
-                            continue
-                    elif any(word.startswith(keyword) for keyword in COLORS):
-                        color = COLORS.get(word[:4], "text")
-                    elif is_valid_date(word):
-                        color = "is_complete"
-
-                # Restore Markdown links and count if necessary
-                if word.startswith("MDLINK"):
-                    i = int(word.replace("MDLINK", ""))
-                    text, url = md_links[i]
-                    if not is_task_complete:
-                        color = "is_link"
-                    if should_count_links:
-                        link_counter += 1
-                        display_text.append((color, text))
-                        display_text.append(("is_link", f" [{link_counter}]"))
-                        display_text.append(("text", " "))
-                        continue
-                    else:
-                        word = text  # If only one link, no need for a counter
-
-                display_text.append((color, word))
-                display_text.append(("text", " "))
-
-            # Remove the trailing space from the colored text
-            display_text = display_text[:-1]
+            # Build (or fetch the memoized) color-coded markup for the task line
+            display_text = list(
+                TaskUI._build_display_text(
+                    task["text"].strip(), task["completed"], hide_dates
+                )
+            )
 
             # Create a custom checkbox for the task and apply the color scheme
             original_text = (
@@ -232,8 +277,87 @@ class TaskUI:
             # Add the checkbox to the list of widgets
             widgets.append(wrapped_checkbox)
 
-        # Return a Pile widget containing all the task widgets
-        return urwid.Pile(widgets)
+            # Remember the widget for the next render
+            TaskUI._widget_cache[cache_key] = wrapped_checkbox
+
+        # Drop the least recently used widgets; the ones used above are all at the end
+        limit = max(TaskUI._WIDGET_CACHE_LIMIT, len(tasks))
+        while len(TaskUI._widget_cache) > limit:
+            TaskUI._widget_cache.popitem(last=False)
+
+        return widgets
+
+    # Color-codes a task line into urwid markup. Memoized: the result only depends on the
+    # arguments, and it is returned as a tuple so the cached value can't be mutated.
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _build_display_text(task_line, is_task_complete, hide_dates):
+        display_text = []
+
+        # Handle Markdown links and replace them with placeholders.
+        # Note: we allow spaces in the destination for custom schemes like
+        # [label](term:some command with args)
+        md_links = []
+
+        def replace_md_link(match):
+            md_links.append((match.group(1), match.group(2)))
+            return f"MDLINK{len(md_links) - 1}"
+
+        if "](" in task_line:
+            task_line = _MD_LINK_RE.sub(replace_md_link, task_line)
+        total_md_links = len(md_links)
+
+        # Count the number of plain text links
+        total_plain_links = sum(1 for _ in _URL_RE.finditer(task_line))
+
+        # Decide if we should count links based on the total number of Markdown and plain text links
+        should_count_links = (total_md_links + total_plain_links) > 1
+
+        # Split the task text into words
+        task_words = task_line.split()
+        link_counter = 0  # Initialize the link counter for each task
+
+        # Loop through each word to apply color-coding logic
+        for index, word in enumerate(task_words):
+            color = "is_complete" if is_task_complete else "text"
+
+            # Completion/creation dates can only be among the first three words
+            if hide_dates and index < 3 and is_valid_date(word):
+                continue
+
+            # Apply color-coding based on the word's prefix or content
+            if not is_task_complete:
+                color, is_url = _word_color(word)
+                if is_url and should_count_links:
+                    link_counter += 1
+                    display_text.append((color, word))
+                    display_text.append(("is_link", f" [{link_counter}]"))
+                    display_text.append(("text", " "))
+                    continue
+
+            # Restore Markdown links and count if necessary
+            if word.startswith("MDLINK"):
+                i = int(word.replace("MDLINK", ""))
+                text, url = md_links[i]
+                if not is_task_complete:
+                    color = "is_link"
+                if should_count_links:
+                    link_counter += 1
+                    display_text.append((color, text))
+                    display_text.append(("is_link", f" [{link_counter}]"))
+                    display_text.append(("text", " "))
+                    continue
+                else:
+                    word = text  # If only one link, no need for a counter
+
+            display_text.append((color, word))
+            display_text.append(("text", " "))
+
+        # Remove the trailing space from the colored text (in place, no copy)
+        if display_text:
+            del display_text[-1]
+
+        return tuple(display_text)
 
     @staticmethod
     def open_task_add_edit_dialog(
@@ -256,10 +380,8 @@ class TaskUI:
         focused_task_index: Index of the currently focused task.
         """
 
-        # Initialize Tasks instance
-        from src.services.task_service import Tasks
-
-        tasks = Tasks(keymap_instance.txt_file)
+        # Share the tasklist's Tasks instance so its file cache stays warm
+        tasks = keymap_instance.tasks
 
         # Function to handle the entered text
         def on_ask(text):
@@ -342,18 +464,8 @@ class TaskUI:
                     None,
                 )
             elif key == "tab":  # Autocomplete logic for projects/contexts
-                first_suggestion = None
-                if (
-                    keymap_instance.auto_suggestions.dialog.body
-                    and len(keymap_instance.auto_suggestions.dialog.body) > 0
-                ):
-                    first_suggestion_widget = (
-                        keymap_instance.auto_suggestions.dialog.body[0]
-                    )
-                    if first_suggestion_widget:
-                        all_suggestions = first_suggestion_widget.get_text()[0]
-                        if all_suggestions:
-                            first_suggestion = all_suggestions.split(", ")[0]
+                suggestions = keymap_instance.auto_suggestions.last_suggestions
+                first_suggestion = suggestions[0] if suggestions else None
                 if first_suggestion:
                     cursor_position = ask.edit_pos
                     existing_text = ask.get_edit_text()
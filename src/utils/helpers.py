@@ -1,5 +1,8 @@
-import re
-from datetime import datetime
+from calendar import isleap
+
+
+# Days per month for a non-leap year, indexed by month number
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
 
 def debug(text):
@@ -7,12 +10,20 @@ def debug(text):
         debug_file.write(f"{text}\n")
 
 def is_valid_date(string):
-    # First check if format is exactly YYYY-MM-DD (strict 2-digit month/day)
-    if not re.match(r'^\d{4}-\d{2}-\d{2}$', string):
+    # Cheap shape check first: exactly YYYY-MM-DD with ASCII digits (strict 2-digit month/day)
+    if len(string) != 10 or string[4] != '-' or string[7] != '-':
+        return False
+
+    year, month, day = string[0:4], string[5:7], string[8:10]
+    if not (string.isascii() and year.isdigit() and month.isdigit() and day.isdigit()):
         return False
 
-    try:
-        datetime.strptime(string, '%Y-%m-%d')
-        return True
-    except ValueError:
-        return False
\ No newline at end of file
+    # Validate the calendar date arithmetically instead of strptime + ValueError
+    year, month, day = int(year), int(month), int(day)
+    if year < 1 or not 1 <= month <= 12 or day < 1:
+        return False
+
+    if month == 2 and isleap(year):
+        return day <= 29
+
+    return day <= _DAYS_IN_MONTH[month]
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+
+from src.services.task_service import Tasks
+
+
+class TrailingNewlineTest(unittest.TestCase):
+    """Rewrites of todo.txt keep the file's trailing newline, or its absence."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.txt_file = os.path.join(tmp_dir.name, "todo.txt")
+
+    def write(self, content):
+        with open(self.txt_file, "w", newline="") as f:
+            f.write(content)
+
+    def contents(self):
+        with open(self.txt_file, newline="") as f:
+            return f.read()
+
+    def test_edit_keeps_trailing_newline(self):
+        self.write("first task\nsecond task\n")
+        Tasks(self.txt_file).edit("second task", "second task edited")
+        content = self.contents()
+        self.assertTrue(content.endswith("\n"))
+        self.assertEqual(content.splitlines()[0], "first task")
+        self.assertIn("second task edited", content.splitlines()[1])
+
+    def test_edit_keeps_missing_trailing_newline(self):
+        self.write("first task\nsecond task")
+        Tasks(self.txt_file).edit("first task", "first task edited")
+        self.assertFalse(self.contents().endswith("\n"))
+
+    def test_delete_keeps_trailing_newline(self):
+        self.write("first task\nsecond task\n")
+        Tasks(self.txt_file).delete("second task")
+        self.assertEqual(self.contents(), "first task\n")
+
+    def test_delete_keeps_missing_trailing_newline(self):
+        self.write("first task\nsecond task")
+        Tasks(self.txt_file).delete("first task")
+        self.assertEqual(self.contents(), "second task")
+
+    def test_postpone_keeps_trailing_newline(self):
+        self.write("first task\nsecond task due:2000-01-01\n")
+        updated = Tasks(self.txt_file).postpone_to_tomorrow("second task due:2000-01-01")
+        self.assertEqual(self.contents(), f"first task\n{updated}\n")
+        self.assertNotEqual(updated, "second task due:2000-01-01")
+
+    def test_postpone_keeps_missing_trailing_newline(self):
+        self.write("first task due:2000-01-01\nsecond task")
+        updated = Tasks(self.txt_file).postpone_to_tomorrow("first task due:2000-01-01")
+        self.assertEqual(self.contents(), f"{updated}\nsecond task")
+
+    def test_postpone_missing_task_leaves_file_alone(self):
+        self.write("first task\n")
+        before = os.stat(self.txt_file).st_mtime_ns
+        result = Tasks(self.txt_file).postpone_to_tomorrow("gone task due:2000-01-01")
+        self.assertIsNone(result)
+        self.assertEqual(self.contents(), "first task\n")
+        self.assertEqual(os.stat(self.txt_file).st_mtime_ns, before)
+
+
+if __name__ == "__main__":
+    unittest.main()